@@ -1,10 +1,26 @@
+import asyncio
+import json
+import random
 import openai
 from dotenv import load_dotenv
 import os
 
+from agents.completion_cache import cache_from_env
+from agents.tool_dispatcher import ToolDispatcher, as_tools, parse_tool_calls, tool_messages
+
 load_dotenv()
 
-client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Created on first use, so importing this module needs no API key
+client = None
+
+# Record/replay cache for ask_chat_agent, set from LEWORD_CHAT_CACHE
+completion_cache = cache_from_env()
+
+def get_client():
+    global client
+    if client is None:
+        client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return client
 
 def init_chat_agent(game):
     """
@@ -24,28 +40,159 @@ def init_chat_agent(game):
         }
     ]
 
-def ask_chat_agent(messages, functions):
+def _request_options(functions, parallel_tools):
+    # `tools` lets the model make several calls in one response, `functions` only one
+    if parallel_tools:
+        return {"tools": as_tools(functions), "tool_choice": "auto"}
+    return {"functions": functions, "function_call": "auto"}
+
+def ask_chat_agent(messages, functions, verbose=True, cache=None, parallel_tools=False):
     """
     Sends messages and function definitions to the OpenAI chat completion API,
-    with automatic function call selection enabled.
+    with automatic function call selection enabled. With `parallel_tools` the
+    functions are offered as tools, so one response can hold several calls
+    (run them with agents.tool_dispatcher). Responses are replayed from
+    `cache` (default: the LEWORD_CHAT_CACHE cache) when recorded.
     """
+    options = _request_options(functions, parallel_tools)
+
+    if verbose:
+        print("Messages sent to OpenAI API:")
+        for msg in messages:
+            print(msg)
 
-    print("Messages sent to OpenAI API:")
-    for msg in messages:
-        print(msg)
+    cache = cache if cache is not None else completion_cache
+    if cache is not None:
+        key, response = cache.lookup("gpt-4o", messages, options.get("tools", functions))
+        if response is not None:
+            return response
 
-    response = client.chat.completions.create(
+    response = get_client().chat.completions.create(
         model="gpt-4o",
         messages=messages,
-        functions=functions,
-        function_call="auto"
+        **options
     )
+    if cache is not None:
+        cache.record(key, response)
     # Return the full response object or just the message part as needed
     return response
 
 def parse_response(response):
+    """Name and arguments of the first call in a response; parse_tool_calls returns them all."""
     try:
-        tool_call = response.choices[0].message.tool_calls[0]
-        return tool_call.function.name, tool_call.function.arguments
+        message = response.choices[0].message
+        if message.tool_calls:
+            tool_call = message.tool_calls[0]
+            return tool_call.function.name, tool_call.function.arguments
+        # Requests made with `functions` come back as a legacy function_call
+        return message.function_call.name, message.function_call.arguments
     except Exception as e:
-        return None, None
\ No newline at end of file
+        return None, None
+
+# Errors worth retrying: the request may well succeed a moment later
+RETRYABLE_ERRORS = (
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+
+class AsyncChatAgent:
+    """
+    Asyncio chat completions client for driving many games from one process.
+    All requests share one pooled HTTP client; `max_concurrency` bounds the
+    requests in flight, and failed requests are retried with exponential
+    backoff and jitter. Recorded responses are replayed from `cache`.
+    """
+
+    def __init__(self, model="gpt-4o", api_key=None, base_url=None, max_concurrency=64,
+                 max_connections=100, timeout=60.0, max_retries=4, backoff=0.5, max_backoff=20.0,
+                 cache=None):
+        import httpx
+
+        self.model = model
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+        )
+        self.client = openai.AsyncOpenAI(
+            api_key=api_key or os.getenv("OPENAI_API_KEY"),
+            base_url=base_url,
+            http_client=self.http_client,
+            max_retries=0,  # retries are handled in ask() so they respect the semaphore
+        )
+        self.cache = cache
+        self.requests = 0
+        self.retries = 0
+
+    async def ask(self, messages, functions, parallel_tools=False):
+        """Async counterpart of ask_chat_agent."""
+        options = _request_options(functions, parallel_tools)
+        if self.cache is not None:
+            key, response = self.cache.lookup(self.model, messages, options.get("tools", functions))
+            if response is not None:
+                return response
+        attempt = 0
+        while True:
+            try:
+                async with self.semaphore:
+                    self.requests += 1
+                    response = await self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        **options
+                    )
+                if self.cache is not None:
+                    self.cache.record(key, response)
+                return response
+            except RETRYABLE_ERRORS:
+                if attempt >= self.max_retries:
+                    raise
+            # Back off outside the semaphore so waiting does not hold a slot
+            delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            attempt += 1
+            self.retries += 1
+
+    async def aclose(self):
+        await self.http_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+async def play_chat_game(agent, game, functions, tools, max_turns=None, parallel_tools=True, dispatcher=None):
+    """
+    Lets the chat model play one game: every call in each response is run
+    with `tools[name](**arguments, game=game)` by a ToolDispatcher (read-only
+    tools concurrently, guesses in order) and all results go back in the next
+    request. The history sent each turn is compacted by ChatContext, so
+    request size stays flat as the game goes on. Returns True if the word was
+    guessed.
+    """
+    from agents.chat_context import ChatContext
+
+    context = ChatContext(game)
+    # Dispatchers share one thread pool (see agents/tool_dispatcher.py)
+    dispatcher = dispatcher or ToolDispatcher(tools)
+    max_turns = max_turns or 2 * game.max_attempts
+    for _ in range(max_turns):
+        response = await agent.ask(context.build(), functions, parallel_tools)
+        calls = parse_tool_calls(response)
+        if not calls or not any(call.name in tools for call in calls):
+            return False
+
+        results = await asyncio.to_thread(dispatcher.dispatch, calls, game)
+        context.add_turn(*tool_messages(calls, results))
+
+        for call, result in zip(calls, results):
+            if call.name == "guess" and isinstance(result, dict) and result.get("correct"):
+                return True
+        if len(game.attempts) >= game.max_attempts:
+            return False
+    return False
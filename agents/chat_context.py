@@ -0,0 +1,86 @@
+import json
+from agents.chat_agent import init_chat_agent
+
+# Marks the summary message; the JSON after it lists every attempt so far
+SUMMARY_MARKER = "Game so far (JSON):"
+IMAGE_PLACEHOLDER = "[board image omitted, see the game summary]"
+
+def estimate_tokens(messages) -> int:
+    """Rough token count (about 4 characters per token) of a message list."""
+    return sum(len(json.dumps(message)) for message in messages) // 4 + 4 * len(messages)
+
+class ChatContext:
+    """
+    Keeps the messages sent to the chat model bounded as a game goes on.
+
+    The system prompt from init_chat_agent is sent unchanged every time so the
+    provider can reuse the prompt prefix. Older turns are replaced by one
+    compact summary of the guesses and feedback so far. Only the newest
+    `keep_turns` function-call turns are sent in full, and only the newest
+    board image in them is kept. If the result is still over
+    `token_budget`, recent turns are dropped too, oldest first.
+    """
+
+    def __init__(self, game, keep_turns=2, token_budget=3000):
+        self.game = game
+        self.keep_turns = keep_turns
+        self.token_budget = token_budget
+        self.system = init_chat_agent(game)
+        self.turns = []   # each turn is the list of messages it added
+        self.hint = None
+
+    def add_turn(self, *messages):
+        """Records one model turn: its function calls and their results."""
+        self.turns.append(list(messages))
+        # Tool results carry only the call id, the name is on the assistant message
+        names = {
+            call["id"]: call["function"]["name"]
+            for message in messages for call in message.get("tool_calls") or ()
+        }
+        for message in messages:
+            name = message.get("name") or names.get(message.get("tool_call_id"))
+            if message.get("role") in ("function", "tool") and name == "hint":
+                self.hint = json.loads(message["content"])
+
+    def summary(self):
+        attempts = [
+            {"guess": a.guess, "feedback": a.feedback, "score": a.score}
+            for a in self.game.attempts
+        ]
+        state = {
+            "attempts": attempts,
+            "attempts_left": self.game.max_attempts - len(self.game.attempts),
+            "word_length": self.game.word_length,
+        }
+        if self.hint is not None:
+            state["hint"] = self.hint
+        return {"role": "user", "content": f"{SUMMARY_MARKER} {json.dumps(state, separators=(',', ':'))}"}
+
+    def _without_images(self, message):
+        if message.get("role") not in ("function", "tool") or "image_base64" not in (message.get("content") or ""):
+            return message
+        content = json.loads(message["content"])
+        content["image_base64"] = IMAGE_PLACEHOLDER
+        return {**message, "content": json.dumps(content)}
+
+    def build(self):
+        """Messages to send for the next request."""
+        recent = self.turns[-self.keep_turns:] if self.keep_turns else []
+        while True:
+            messages = list(self.system)
+            if self.game.attempts or self.hint is not None:
+                messages.append(self.summary())
+            # Drop every board image except the newest one
+            newest_image = None
+            for i, turn in enumerate(recent):
+                for message in turn:
+                    if message.get("role") in ("function", "tool") and "image_base64" in (message.get("content") or ""):
+                        newest_image = (i, id(message))
+            for i, turn in enumerate(recent):
+                for message in turn:
+                    keep = newest_image == (i, id(message))
+                    messages.append(message if keep else self._without_images(message))
+
+            if not recent or estimate_tokens(messages) <= self.token_budget:
+                return messages
+            recent = recent[1:]
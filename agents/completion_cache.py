@@ -0,0 +1,206 @@
+# agents/completion_cache.py
+import fcntl
+import hashlib
+import json
+import os
+import struct
+import threading
+import zlib
+from contextlib import contextmanager
+
+import numpy as np
+
+# Record header in the data file: magic, key digest, compressed payload size
+RECORD_MAGIC = b"LWCC"
+RECORD_HEADER = struct.Struct("<4s32sI")
+# One fixed-width index entry per record, so the whole index loads in one read
+INDEX_DTYPE = np.dtype([("key", "S32"), ("offset", "<u8"), ("length", "<u4")])
+
+MODES = ("off", "record", "strict")
+
+
+class CompletionCacheMiss(KeyError):
+    """Raised in strict mode when a request was never recorded."""
+
+
+def request_key(model, messages, functions):
+    """
+    Canonical digest of a chat completions request. Dict key order and
+    whitespace do not matter; anything that changes the request does.
+    """
+    canonical = json.dumps(
+        {"model": model, "messages": messages, "functions": functions or []},
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).digest()
+
+
+class CompletionCache:
+    """
+    Record/replay store for chat completions, so agent runs and CI can replay
+    earlier API responses offline.
+
+    Responses are zlib-compressed JSON appended to `completions.dat`; every
+    record also gets a fixed-width entry in `completions.idx`, which is read
+    into a dict on open. Existing records are never rewritten. If the index
+    is missing or behind the data file (e.g. after a crash) it is rebuilt by
+    scanning the record headers. Several processes may record into the same
+    directory: appends and rebuilds hold an exclusive flock on the data file,
+    and a miss first picks up index entries other processes have added.
+
+    In "record" mode a miss calls the API and stores the response; in
+    "strict" mode a miss raises CompletionCacheMiss instead.
+    """
+
+    def __init__(self, cache_dir, mode="record"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown completion cache mode: {mode}")
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self.data_path = os.path.join(cache_dir, "completions.dat")
+        self.index_path = os.path.join(cache_dir, "completions.idx")
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.index = {}
+        self.indexed = 0  # index entries read so far
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+
+    @contextmanager
+    def _file_lock(self):
+        """Exclusive flock on the data file, shared with other processes using the cache."""
+        with open(self.data_path, "ab") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield f
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load_index(self):
+        with self._file_lock():
+            data_size = os.path.getsize(self.data_path)
+            entries = np.zeros(0, dtype=INDEX_DTYPE)
+            if os.path.exists(self.index_path):
+                entries = np.fromfile(self.index_path, dtype=INDEX_DTYPE)
+            indexed_size = 0
+            if len(entries):
+                last = entries[-1]
+                indexed_size = int(last["offset"]) + RECORD_HEADER.size + int(last["length"])
+            if indexed_size != data_size:
+                entries = self._scan(data_size)
+                tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+                entries.tofile(tmp_path)
+                os.replace(tmp_path, self.index_path)
+        self.index = {}
+        self.indexed = 0
+        self._add_entries(entries)
+
+    def _add_entries(self, entries):
+        # Later records win, so re-recording a request replaces its response
+        for e in entries:
+            self.index[bytes(e["key"])] = (int(e["offset"]), int(e["length"]))
+        self.indexed += len(entries)
+
+    def _refresh(self):
+        """Reads index entries appended (by any process) since the last read."""
+        if not os.path.exists(self.index_path):
+            return
+        entries = np.fromfile(self.index_path, dtype=INDEX_DTYPE, offset=self.indexed * INDEX_DTYPE.itemsize)
+        self._add_entries(entries)
+
+    def _scan(self, data_size):
+        """Index entries for every complete record in the data file."""
+        entries = []
+        with open(self.data_path, "rb") as f:
+            offset = 0
+            while offset + RECORD_HEADER.size <= data_size:
+                magic, key, length = RECORD_HEADER.unpack(f.read(RECORD_HEADER.size))
+                if magic != RECORD_MAGIC or offset + RECORD_HEADER.size + length > data_size:
+                    break
+                entries.append((key, offset, length))
+                offset += RECORD_HEADER.size + length
+                f.seek(offset)
+        if offset != data_size:
+            # Drop a torn record left by an interrupted write
+            with open(self.data_path, "r+b") as f:
+                f.truncate(offset)
+        return np.array(entries, dtype=INDEX_DTYPE)
+
+    def get(self, key):
+        """Stored response dict for `key`, or None."""
+        with self.lock:
+            location = self.index.get(key)
+            if location is None:
+                self._refresh()
+                location = self.index.get(key)
+        if location is None:
+            return None
+        offset, length = location
+        with open(self.data_path, "rb") as f:
+            f.seek(offset + RECORD_HEADER.size)
+            return json.loads(zlib.decompress(f.read(length)))
+
+    def put(self, key, response):
+        payload = zlib.compress(json.dumps(response, separators=(",", ":")).encode("utf-8"))
+        with self.lock, self._file_lock() as f:
+            # Other processes may have appended since this handle was opened
+            offset = f.seek(0, os.SEEK_END)
+            f.write(RECORD_HEADER.pack(RECORD_MAGIC, key, len(payload)) + payload)
+            f.flush()
+            # Pick up their index entries first, so self.indexed stays in step with the file
+            self._refresh()
+            with open(self.index_path, "ab") as index_file:
+                np.array([(key, offset, len(payload))], dtype=INDEX_DTYPE).tofile(index_file)
+            self._add_entries(np.array([(key, offset, len(payload))], dtype=INDEX_DTYPE))
+
+    def lookup(self, model, messages, functions):
+        """
+        Returns (key, recorded ChatCompletion or None). Raises
+        CompletionCacheMiss on a miss in strict mode.
+        """
+        from openai.types.chat import ChatCompletion
+
+        key = request_key(model, messages, functions)
+        response = self.get(key)
+        with self.lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if response is not None:
+            return key, ChatCompletion.model_validate(response)
+        if self.mode == "strict":
+            raise CompletionCacheMiss(
+                f"No recorded completion for request {key.hex()[:16]} in {self.cache_dir}"
+            )
+        return key, None
+
+    def record(self, key, response):
+        self.put(key, response.model_dump(mode="json", exclude_unset=True))
+
+    def stats(self):
+        with self.lock:
+            return {
+                "mode": self.mode,
+                "entries": len(self.index),
+                "hits": self.hits,
+                "misses": self.misses,
+                "data_bytes": os.path.getsize(self.data_path) if os.path.exists(self.data_path) else 0,
+            }
+
+    def __len__(self):
+        return len(self.index)
+
+
+def cache_from_env():
+    """
+    Cache configured by LEWORD_CHAT_CACHE (a directory) and
+    LEWORD_CHAT_CACHE_MODE ("record" by default, or "strict" for CI);
+    None when caching is off.
+    """
+    cache_dir = os.getenv("LEWORD_CHAT_CACHE", "")
+    mode = os.getenv("LEWORD_CHAT_CACHE_MODE", "record")
+    if not cache_dir or mode == "off":
+        return None
+    return CompletionCache(cache_dir, mode)
@@ -0,0 +1,167 @@
+"""
+Local stand-in for the chat completions endpoint, for exercising the chat
+agents without network access or API keys. It answers every request with a
+`guess` function call chosen by the word agent from the feedback in the
+conversation.
+
+    python -m agents.mock_chat_server --port 8089 --latency-ms 200
+    AsyncChatAgent(base_url="http://127.0.0.1:8089/v1", api_key="test")
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+
+from agents.word_agent import word_agent_decide_guess
+from agents.chat_context import SUMMARY_MARKER
+from models.schemas import GameState, GuessResult
+
+WORD_LENGTH_PATTERN = re.compile(r"EXACTLY (\d+) letters long")
+
+
+def _game_state(messages):
+    word_length = 5
+    attempts = {}
+    for message in messages:
+        content = message.get("content") or ""
+        if message.get("role") == "system":
+            match = WORD_LENGTH_PATTERN.search(content)
+            if match:
+                word_length = int(match.group(1))
+        elif content.startswith(SUMMARY_MARKER):
+            # Compacted history from agents.chat_context.ChatContext
+            for result in json.loads(content[len(SUMMARY_MARKER):])["attempts"]:
+                attempts[result["guess"]] = result
+        elif message.get("role") in ("function", "tool") and '"feedback"' in content:
+            result = json.loads(content)
+            attempts[result["guess"]] = result
+    return GameState(
+        attempts=[
+            GuessResult(guess=r["guess"], feedback=r["feedback"], correct=r.get("correct", False))
+            for r in attempts.values()
+        ],
+        attempts_left=0,
+        word_length=word_length
+    )
+
+
+def completion(request):
+    """
+    Builds a chat.completion response that calls `guess`. With `tools`, the
+    first response also asks for the hint and the board, like a model making
+    parallel tool calls.
+    """
+    game_state = _game_state(request.get("messages", []))
+    next_guess = word_agent_decide_guess(None, game_state)
+    call = {"name": "guess", "arguments": json.dumps({"guess": next_guess})}
+    message = {"role": "assistant", "content": None}
+    if request.get("tools"):
+        calls = [call]
+        if not game_state.attempts:
+            calls = [{"name": "hint", "arguments": "{}"}, {"name": "show_board_image", "arguments": "{}"}, call]
+        message["tool_calls"] = [
+            {"id": f"call_{random.getrandbits(48):x}", "type": "function", "function": c} for c in calls
+        ]
+    else:
+        message["function_call"] = call
+    return {
+        "id": f"chatcmpl-{random.getrandbits(64):x}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.get("model", "mock"),
+        "choices": [{"index": 0, "message": message, "finish_reason": "function_call"}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+class MockChatServer:
+    """Minimal HTTP/1.1 keep-alive server for POST .../chat/completions."""
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0.0, error_rate=0.0):
+        self.host = host
+        self.port = port
+        self.latency = latency_ms / 1000.0
+        self.error_rate = error_rate
+        self.server = None
+        self.requests = 0
+        self.errors = 0
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}/v1"
+
+    async def start(self):
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def _respond(self, writer, status, body):
+        reason = {200: "OK", 404: "Not Found", 500: "Internal Server Error", 503: "Service Unavailable"}[status]
+        payload = json.dumps(body).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: keep-alive\r\n\r\n".encode("ascii") + payload
+        )
+        await writer.drain()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                if method != "POST" or not path.rstrip("/").endswith("/chat/completions"):
+                    await self._respond(writer, 404, {"error": {"message": f"No route for {method} {path}"}})
+                elif random.random() < self.error_rate:
+                    self.errors += 1
+                    await self._respond(writer, 503, {"error": {"message": "Injected failure"}})
+                else:
+                    await self._respond(writer, 200, completion(json.loads(body or b"{}")))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _serve(args):
+    server = await MockChatServer(args.host, args.port, args.latency_ms, args.error_rate).start()
+    print(f"Mock chat completions listening on {server.base_url}")
+    await server.server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the chat completions API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with a 503")
+    asyncio.run(_serve(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
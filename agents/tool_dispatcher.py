@@ -0,0 +1,136 @@
+# agents/tool_dispatcher.py
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Tools that only read the game; calls to them may run at the same time.
+# Anything else (guess) changes the game and runs alone, in order.
+READ_ONLY_TOOLS = frozenset({"hint", "show_board_image", "render_board"})
+
+# Threads shared by every dispatcher, so hundreds of concurrent games share one pool
+SHARED_POOL_WORKERS = 8
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_pool():
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ThreadPoolExecutor(max_workers=SHARED_POOL_WORKERS, thread_name_prefix="tools")
+        return _shared_pool
+
+
+class ToolCall:
+    """One function call requested by the model; `id` is None for a legacy function_call."""
+    __slots__ = ("id", "name", "arguments")
+
+    def __init__(self, id, name, arguments):
+        self.id = id
+        self.name = name
+        self.arguments = arguments
+
+    def __repr__(self):
+        return f"ToolCall(id={self.id!r}, name={self.name!r}, arguments={self.arguments!r})"
+
+
+def as_tools(functions):
+    """`functions` definitions (see tools/game_tools.available_tools) in the `tools` request format."""
+    return [{"type": "function", "function": function} for function in functions]
+
+
+def parse_tool_calls(response):
+    """Every tool call in a chat completion response, in order; [] if there are none."""
+    try:
+        message = response.choices[0].message
+    except (AttributeError, IndexError):
+        return []
+    if message.tool_calls:
+        return [ToolCall(call.id, call.function.name, call.function.arguments) for call in message.tool_calls]
+    if message.function_call:
+        return [ToolCall(None, message.function_call.name, message.function_call.arguments)]
+    return []
+
+
+class ToolDispatcher:
+    """
+    Runs all the tool calls of one model response against a game. Runs of
+    consecutive read-only calls execute concurrently on a thread pool; every
+    other call waits for the calls before it and runs alone, so the model sees
+    the same results as if the calls had run one by one. A call that fails
+    gets an {"error": ...} result instead of stopping the others.
+
+    Dispatchers run on the process-wide shared_pool() unless given `max_workers`,
+    so creating one per game costs nothing.
+    """
+
+    def __init__(self, tools, read_only=READ_ONLY_TOOLS, max_workers=None):
+        self.tools = tools
+        self.read_only = read_only
+        self.own_pool = max_workers is not None
+        if self.own_pool:
+            self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tools")
+        else:
+            self.pool = shared_pool()
+
+    def _run(self, call, game):
+        if call.name not in self.tools:
+            return {"error": f"Unknown tool: {call.name}"}
+        try:
+            arguments = json.loads(call.arguments or "{}")
+            return self.tools[call.name](**arguments, game=game)
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+
+    def dispatch(self, calls, game):
+        """Results of `calls`, in the same order."""
+        results = [None] * len(calls)
+        pending = []
+        for i, call in enumerate(calls):
+            if call.name in self.read_only:
+                pending.append((i, self.pool.submit(self._run, call, game)))
+                continue
+            # A state-changing call waits for the reads queued before it
+            for j, future in pending:
+                results[j] = future.result()
+            pending = []
+            results[i] = self._run(call, game)
+        for j, future in pending:
+            results[j] = future.result()
+        return results
+
+    def close(self):
+        """Shuts down the dispatcher's own pool; the shared pool stays up."""
+        if self.own_pool:
+            self.pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def tool_messages(calls, results):
+    """
+    The assistant message that made `calls` followed by their results, ready
+    to append to the conversation for the follow-up request.
+    """
+    if calls and calls[0].id is None:
+        call = calls[0]
+        return [
+            {"role": "assistant", "content": None,
+             "function_call": {"name": call.name, "arguments": call.arguments or "{}"}},
+            {"role": "function", "name": call.name, "content": json.dumps(results[0])},
+        ]
+    messages = [{
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [
+            {"id": call.id, "type": "function", "function": {"name": call.name, "arguments": call.arguments or "{}"}}
+            for call in calls
+        ],
+    }]
+    for call, result in zip(calls, results):
+        messages.append({"role": "tool", "tool_call_id": call.id, "content": json.dumps(result)})
+    return messages
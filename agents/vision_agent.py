@@ -1,17 +1,58 @@
-from vision.vision_models import encode_board_image
+import threading
 from PIL import Image
 import numpy as np
-from transformers import CLIPProcessor, CLIPModel
+from vision.model_registry import get_model
+from vision.batching import BatchingEncoder
+from vision.symbolic_encoder import encode_game_state
+from tools.tracing import tracer
 
-# def vision_agent_process_board(image: Image.Image) -> np.ndarray:
+# def vision_agent_process_board(image) -> np.ndarray:
 #     """Encodes the board image into a feature vector."""
 #     embedding = encode_board_image(image)
 #     return embedding
 
-clip_model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32")
-clip_processor = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
+# Registered image encoder for boards; "stub-clip" is a deterministic offline stand-in
+VISION_MODEL = "hf-clip"
 
-def vision_agent_process_board(image: Image.Image) -> np.ndarray:
-    inputs = clip_processor(images=image, return_tensors="pt")
-    outputs = clip_model.get_image_features(**inputs)
-    return outputs[0].detach().numpy()
+_board_batcher = None
+_board_batcher_lock = threading.Lock()
+
+def vision_agent_process_boards(images: list) -> np.ndarray:
+    """
+    Encodes several board images in one CLIP forward pass. Images may be PIL
+    images or (height, width, 3) uint8 arrays such as BoardCanvas.array(),
+    which the processor reads directly.
+    """
+    tracer.count("model_calls")
+    if VISION_MODEL != "hf-clip":
+        return get_model(VISION_MODEL).encode(images)
+
+    import torch
+
+    # CLIP is loaded on the first call rather than at import time
+    clip_model, clip_processor = get_model("hf-clip")
+    inputs = clip_processor(images=images, return_tensors="pt")
+    with torch.no_grad():
+        outputs = clip_model.get_image_features(**inputs)
+    return outputs.numpy()
+
+def vision_agent_process_board(image) -> np.ndarray:
+    return vision_agent_process_boards([image])[0]
+
+def board_batcher(max_batch_size=32, max_wait_ms=5.0) -> BatchingEncoder:
+    """
+    Shared batching front end to CLIP for running many games concurrently;
+    callers use .encode(image) from threads or await .aencode(image).
+    """
+    global _board_batcher
+    with _board_batcher_lock:
+        if _board_batcher is None:
+            _board_batcher = BatchingEncoder(vision_agent_process_boards, max_batch_size, max_wait_ms)
+        return _board_batcher
+
+def symbolic_agent_process_board(game_state) -> np.ndarray:
+    """
+    Drop-in alternative to vision_agent_process_board that encodes the game
+    state directly, skipping the render and CLIP steps.
+    """
+    return encode_game_state(game_state)
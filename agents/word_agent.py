@@ -1,15 +1,223 @@
 import random
+import numpy as np
 from models.schemas import GameState
+from game.feedback import batch_feedback
+from game.candidate_index import CandidateIndex
+from game.lexicon import load_lexicon
+from game.opening_book import open_opening_book
 
+# Word lists partitioned by length, from LEWORD_LEXICON (see game/lexicon.py).
+# Opening it reads only the header; a length's words are decoded on first use.
+LEXICON = load_lexicon()
+
+# Built-in list used when there is no lexicon
 POSSIBLE_WORDS = [
     "mazda", "toyota", "subaru", "honda", "nissan", "suzuki", "lexus", "datsun"
 ]
 
-def word_agent_decide_guess(vision_embedding, game_state: GameState) -> str:
-    previous_guesses = {attempt.guess for attempt in game_state.attempts}
-    remaining_words = [word for word in POSSIBLE_WORDS if word not in previous_guesses]
+# "entropy" plays the information-maximizing guess, "random" the old behaviour.
+SOLVER_MODE = "entropy"
+
+# With this few candidates left, just guess one of them.
+FAST_PATH_CANDIDATES = 2
+
+# Pattern cells (guess rows x candidates) scored per chunk, bounds the
+# temporaries of expected_information to a few tens of MB for any lexicon.
+ENTROPY_CHUNK_CELLS = 1 << 21
+
+# Candidate indexes built so far, keyed by the id of their word list
+_indexes = {}
+
+# Opening books looked up so far (None when not built), keyed like _indexes
+_books = {}
+
+def _candidate_index(words, word_length) -> CandidateIndex:
+    key = (id(words), word_length)
+    if key not in _indexes or _indexes[key][0] is not words:
+        index = CandidateIndex([word for word in words if len(word) == word_length])
+        _indexes[key] = (words, index)
+    return _indexes[key][1]
+
+def _default_words(word_length):
+    """The lexicon's words of this length, or POSSIBLE_WORDS without a lexicon."""
+    if LEXICON is not None and LEXICON.count(word_length):
+        return LEXICON.words(word_length)
+    return POSSIBLE_WORDS
+
+def all_words():
+    """Every word the agent can play: the whole lexicon, or POSSIBLE_WORDS without one."""
+    return LEXICON.all_words() if LEXICON is not None else POSSIBLE_WORDS
+
+def game_lexicon(word_length):
+    """LEXICON when it has words of this length, for LeWordGame to check guesses against; else None."""
+    if LEXICON is not None and LEXICON.count(word_length):
+        return LEXICON
+    return None
+
+def _opening_book(words, word_length):
+    """Prebuilt opening book for this word list (see game/opening_book.py), or None."""
+    key = (id(words), word_length)
+    if key not in _books or _books[key][0] is not words:
+        book_words = [word for word in words if len(word) == word_length]
+        _books[key] = (words, open_opening_book(book_words))
+    return _books[key][1]
+
+def candidate_words(game_state: GameState, words=None, candidates=None) -> list:
+    """
+    Words of the right length that are consistent with every feedback so far.
+    Pass the game's CandidateSet as `candidates` to only apply the new attempts.
+    """
+    words = _default_words(game_state.word_length) if words is None else words
+    if candidates is None:
+        candidates = _candidate_index(words, game_state.word_length).candidates()
+    candidates.sync([(attempt.guess, attempt.feedback) for attempt in game_state.attempts])
+    return candidates.words()
+
+def _patterns(guesses, candidates, table=None):
+    if table is not None:
+        return table.matrix[np.ix_(table.indices(guesses), table.indices(candidates))]
+    return batch_feedback(guesses, candidates)
+
+def _chunk_rows(n_candidates, word_length):
+    """Guess rows per chunk so each chunk stays within ENTROPY_CHUNK_CELLS."""
+    return max(1, ENTROPY_CHUNK_CELLS // max(n_candidates, 3 ** word_length, 1))
+
+def expected_information(guesses, candidates, table=None) -> np.ndarray:
+    """
+    Entropy (in bits) of the feedback partition each guess induces over the
+    remaining candidates. Guesses are scored a chunk of rows at a time.
+    """
+    word_length = len(candidates[0])
+    info = np.empty(len(guesses))
+    step = _chunk_rows(len(candidates), word_length)
+    for start in range(0, len(guesses), step):
+        chunk = guesses[start:start + step]
+        info[start:start + len(chunk)] = _partition_entropy(_patterns(chunk, candidates, table), word_length)
+    return info
+
+def _partition_entropy(patterns, word_length) -> np.ndarray:
+    """Entropy of each row of a (guesses, candidates) pattern matrix."""
+    n_guesses, total = patterns.shape
+    info = np.empty(n_guesses)
+    n_patterns = 3 ** word_length
+    step = _chunk_rows(total, word_length)
+    for start in range(0, n_guesses, step):
+        rows = patterns[start:start + step]
+        if n_patterns * len(rows) <= ENTROPY_CHUNK_CELLS:
+            counts = _bucket_counts(rows, n_patterns)
+        else:
+            counts = _run_lengths(rows)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weighted = np.where(counts > 0, counts * np.log2(counts), 0.0).sum(axis=1)
+        info[start:start + len(rows)] = np.log2(total) - weighted / total
+    return info
+
+def _bucket_counts(rows, n_patterns) -> np.ndarray:
+    """(rows, n_patterns) count of candidates per pattern, one bincount for all rows."""
+    offsets = np.arange(len(rows), dtype=np.int64)[:, None] * n_patterns
+    counts = np.bincount((rows + offsets).ravel(), minlength=len(rows) * n_patterns)
+    return counts.reshape(len(rows), n_patterns).astype(np.float64)
+
+def _run_lengths(rows) -> np.ndarray:
+    """
+    Per-row sizes of the pattern buckets, for long words where a bincount
+    over all 3**word_length patterns would not fit. Rows are sorted in their
+    own dtype and runs of equal codes counted; the result is padded with zeros.
+    """
+    ordered = np.sort(rows, axis=1)
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    flat = np.flatnonzero(starts.ravel())
+    lengths = np.diff(np.append(flat, ordered.size))
+    width = ordered.shape[1]
+    row = flat // width
+    # Each run's size goes in the column where the run starts
+    counts = np.zeros(ordered.shape, dtype=np.float64)
+    counts[row, flat - row * width] = lengths
+    return counts
+
+def best_guess(candidates, guess_pool, table=None) -> str:
+    """Guess from `guess_pool` that maximizes expected information over `candidates`."""
+    if len(candidates) <= FAST_PATH_CANDIDATES:
+        return candidates[0]
+
+    info = expected_information(guess_pool, candidates, table)
+    # Break ties in favour of guesses that could still be the answer
+    candidate_set = set(candidates)
+    info += np.array([word in candidate_set for word in guess_pool]) * 1e-6
+    return guess_pool[int(np.argmax(info))]
+
+def word_agent_decide_guess(vision_embedding, game_state: GameState, mode=None, words=None, table=None, candidates=None, book=None) -> str:
+    mode = SOLVER_MODE if mode is None else mode
+    words = _default_words(game_state.word_length) if words is None else words
+    previous_guesses = {attempt.guess.lower() for attempt in game_state.attempts}
+
+    if mode == "random":
+        remaining_words = [word for word in words if word not in previous_guesses]
+        if not remaining_words:
+            return "mazda"  # fallback
+        return random.choice(remaining_words)
+
+    # The first guesses come straight from the opening book when one is built
+    book = _opening_book(words, game_state.word_length) if book is None else book
+    if book is not None and len(game_state.attempts) < book.depth:
+        guess = book.lookup([(attempt.guess, attempt.feedback) for attempt in game_state.attempts])
+        if guess is not None:
+            return guess
+
+    candidates = [word for word in candidate_words(game_state, words, candidates) if word not in previous_guesses]
+    if not candidates:
+        return word_agent_decide_guess(vision_embedding, game_state, "random", words)
+
+    guess_pool = [
+        word for word in words
+        if len(word) == game_state.word_length and word not in previous_guesses
+    ]
+    return best_guess(candidates, guess_pool, table)
 
-    if not remaining_words:
-        return "mazda"  # fallback
+def word_agent_decide_multi_guess(game, words=None) -> str:
+    """
+    Next guess for a multi-target game (game/multi_game.py). A board down to
+    one candidate is finished off first; otherwise the guess maximizes the
+    information summed over the open boards, scored against the union of
+    their candidates in one batch.
+    """
+    words = _default_words(game.word_length) if words is None else words
+    previous_guesses = {attempt.guess for attempt in game.attempts}
+    open_boards = np.flatnonzero(~game.solved)
+    # Each board's candidates are narrowed only by the guesses made since the last call
+    key = id(words)
+    if key not in game.candidate_sets or game.candidate_sets[key][0] is not words:
+        index = _candidate_index(words, game.word_length)
+        game.candidate_sets[key] = (words, [index.candidates() for _ in range(game.n_boards)])
+    candidate_sets = game.candidate_sets[key][1]
+    board_candidates = []
+    for board in open_boards:
+        remaining = [
+            w for w in candidate_words(game.board_state(board), words, candidate_sets[board])
+            if w not in previous_guesses
+        ]
+        if len(remaining) == 1:
+            return remaining[0]
+        if remaining:
+            board_candidates.append(remaining)
+    if not board_candidates:
+        return word_agent_decide_guess(None, game.board_state(open_boards[0]), "random", words)
 
-    return random.choice(remaining_words)
+    union = sorted(set().union(*board_candidates))
+    column = {word: i for i, word in enumerate(union)}
+    guess_pool = [
+        word for word in words
+        if len(word) == game.word_length and word not in previous_guesses
+    ]
+    board_columns = [[column[w] for w in remaining] for remaining in board_candidates]
+    info = np.zeros(len(guess_pool))
+    step = _chunk_rows(len(union), game.word_length)
+    for start in range(0, len(guess_pool), step):
+        patterns = _patterns(guess_pool[start:start + step], union)
+        for columns in board_columns:
+            info[start:start + len(patterns)] += _partition_entropy(patterns[:, columns], game.word_length)
+    # Break ties in favour of guesses that could solve a board
+    candidate_set = set(union)
+    info += np.array([word in candidate_set for word in guess_pool]) * 1e-6
+    return guess_pool[int(np.argmax(info))]
@@ -0,0 +1,203 @@
+"""
+Benchmarks for the game, rendering, vision and agent hot paths.
+
+Runs offline with seeded word lists and the deterministic stub vision encoder
+unless --real-vision is given. Results can be saved as a baseline and later
+runs compared against it; a stage slower than the baseline by more than
+--threshold is reported as a regression and makes the run exit with status 1.
+
+    python benchmarks/bench_suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --baseline benchmarks/baseline.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import string
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SEED = 1234
+WORD_LENGTH = 5
+LEXICON_SIZE = 2000
+
+
+def make_words(n, word_length=WORD_LENGTH, seed=SEED):
+    """Fixed pseudo-word list, identical on every run."""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choice(string.ascii_lowercase[:20]) for _ in range(word_length)))
+    return sorted(words)
+
+
+def make_game(target, guesses, max_attempts=10):
+    from game.leword_game import LeWordGame
+
+    game = LeWordGame(target, "benchmark", max_attempts)
+    for word in guesses:
+        game.guess(word)
+    return game
+
+
+def make_game_state(game):
+    from models.schemas import GameState, GuessResult
+
+    return GameState(
+        attempts=[GuessResult(guess=a.guess, feedback=a.feedback, correct=a.correct) for a in game.attempts],
+        attempts_left=game.max_attempts - len(game.attempts),
+        word_length=game.word_length
+    )
+
+
+def timeit(fn, repeat, number):
+    """Per-call seconds of `number` calls, `repeat` times, plus peak traced memory."""
+    fn()  # warm-up: imports, sprite and model caches
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return samples, peak
+
+
+def build_benchmarks(words):
+    """name -> (callable, calls per sample)."""
+    from game.leword_game import LeWordGame
+    from game.feedback import batch_feedback
+    from tools.game_tools import show_board_image
+    from vision.render_board import render_leword_board
+    from agents.vision_agent import vision_agent_process_board, symbolic_agent_process_board
+    from agents.word_agent import word_agent_decide_guess
+
+    rng = random.Random(SEED)
+    pairs = [(rng.choice(words), rng.choice(words)) for _ in range(200)]
+    target = words[0]
+    history = rng.sample(words, 4)
+    game = make_game(target, history)
+    game_state = make_game_state(game)
+    feedback_rows = [list(a.feedback) for a in game.attempts]
+    board_img = render_leword_board(feedback_rows, WORD_LENGTH, backend="pil")
+    scorer = LeWordGame(target, "benchmark")
+
+    def guess_pairs():
+        for guess, answer in pairs:
+            g = LeWordGame(answer, "")
+            g.guess(guess)
+
+    def fresh_board_image():
+        # A new game per call so the canvas memo never hits
+        show_board_image(make_game(target, history))
+
+    def run_turn(cold=False):
+        import main
+        if cold:
+            main.embedding_cache.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            main.run_turn(make_game(target, history))
+
+    return {
+        "game.guess x200": (guess_pairs, 5),
+        "calculate_score x200": (lambda: [scorer.calculate_score(a.feedback) for _ in range(40) for a in game.attempts], 5),
+        "batch_feedback 1000x1000": (lambda: batch_feedback(words[:1000], words[:1000]), 1),
+        "render_leword_board matplotlib": (lambda: render_leword_board(feedback_rows, WORD_LENGTH, backend="matplotlib"), 1),
+        "render_leword_board pil": (lambda: render_leword_board(feedback_rows, WORD_LENGTH, backend="pil"), 20),
+        "show_board_image fresh": (fresh_board_image, 10),
+        "show_board_image memoized": (lambda: show_board_image(game), 200),
+        "vision_agent_process_board": (lambda: vision_agent_process_board(board_img), 5),
+        "vision_agent_process_board array": (lambda: vision_agent_process_board(game.board.array(min_rows=1)), 5),
+        "symbolic_agent_process_board": (lambda: symbolic_agent_process_board(game_state), 50),
+        "word_agent_decide_guess": (lambda: word_agent_decide_guess(None, game_state, words=words), 2),
+        "run_turn cold embedding cache": (lambda: run_turn(cold=True), 2),
+        "run_turn warm embedding cache": (run_turn, 2),
+    }
+
+
+def run(repeat, only=None, real_vision=False):
+    import agents.vision_agent
+    import agents.word_agent
+
+    if not real_vision:
+        agents.vision_agent.VISION_MODEL = "stub-clip"
+    random.seed(SEED)
+    words = make_words(LEXICON_SIZE)
+    # run_turn plays with the word agent's default list
+    agents.word_agent.LEXICON = None
+    agents.word_agent.POSSIBLE_WORDS = words
+
+    results = {}
+    for name, (fn, number) in build_benchmarks(words).items():
+        if only and only not in name:
+            continue
+        samples, peak = timeit(fn, repeat, number)
+        median = statistics.median(samples)
+        results[name] = {
+            "median_ms": median * 1000.0,
+            "min_ms": min(samples) * 1000.0,
+            "ops_per_s": 1.0 / median if median else float("inf"),
+            "peak_kib": peak / 1024.0,
+        }
+        print(f"{name:34s} {median * 1000.0:10.3f} ms  {1.0 / median:12.1f} ops/s  {peak / 1024.0:10.1f} KiB peak",
+              file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Names of the benchmarks whose median got slower than baseline * threshold."""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        ratio = result["median_ms"] / before["median_ms"] if before["median_ms"] else 1.0
+        result["baseline_ratio"] = ratio
+        if ratio > threshold:
+            regressions.append(name)
+            print(f"REGRESSION {name}: {before['median_ms']:.3f} ms -> {result['median_ms']:.3f} ms ({ratio:.2f}x)",
+                  file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LeWord hot paths.")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark")
+    parser.add_argument("--only", help="run only benchmarks whose name contains this")
+    parser.add_argument("--real-vision", action="store_true", help="use the real CLIP model instead of the stub")
+    parser.add_argument("--baseline", help="compare against this saved baseline")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio counted as a regression")
+    parser.add_argument("--save-baseline", help="write these results as a baseline")
+    args = parser.parse_args()
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": SEED,
+        "results": run(args.repeat, args.only, args.real_vision),
+    }
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report["results"], json.load(f), args.threshold)
+        report["regressions"] = regressions
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
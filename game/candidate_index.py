@@ -0,0 +1,126 @@
+# game/candidate_index.py
+from collections import Counter
+
+import numpy as np
+
+
+def _to_bitset(flags):
+    """Packs a boolean array into a Python int with bit i set where flags[i]."""
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+
+def _from_bitset(bits, size):
+    """Indices of the set bits of `bits`, as an array."""
+    data = bits.to_bytes((size + 7) // 8, "little")
+    flags = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder="little", count=size)
+    return np.flatnonzero(flags)
+
+
+class CandidateIndex:
+    """
+    Bitset index over a word list. Each (position, letter) pair and each
+    "letter occurs at least k times" condition is a Python int with one bit per
+    word, so a feedback row narrows the candidates with a few ANDs.
+    """
+
+    def __init__(self, words):
+        self.words = [word.lower() for word in words]
+        self.word_length = len(self.words[0]) if self.words else 0
+        if any(len(word) != self.word_length for word in self.words):
+            raise ValueError("All words must have the same length.")
+        self.full_mask = (1 << len(self.words)) - 1
+        self.word_index = {word: i for i, word in enumerate(self.words)}
+
+        encoded = np.frombuffer("".join(self.words).encode("latin-1"), dtype=np.uint8)
+        encoded = encoded.reshape(len(self.words), self.word_length)
+        letters = np.unique(encoded)
+
+        # positions[i][c]: words with letter c at position i
+        self.positions = [
+            {chr(letter): _to_bitset(encoded[:, i] == letter) for letter in letters}
+            for i in range(self.word_length)
+        ]
+        # at_least[c][k]: words containing letter c at least k times (k >= 1)
+        self.at_least = {}
+        for letter in letters:
+            counts = (encoded == letter).sum(axis=1)
+            self.at_least[chr(letter)] = [self.full_mask] + [
+                _to_bitset(counts >= k) for k in range(1, int(counts.max()) + 1)
+            ]
+
+    def __len__(self):
+        return len(self.words)
+
+    def count_mask(self, letter, minimum, exact=False):
+        """Words with at least `minimum` copies of letter (exactly, if `exact`)."""
+        masks = self.at_least.get(letter, [self.full_mask])
+        mask = masks[minimum] if minimum < len(masks) else 0
+        if exact and minimum + 1 < len(masks):
+            mask &= ~masks[minimum + 1]
+        return mask
+
+    def constraint_mask(self, guess, feedback):
+        """Words that would have produced `feedback` for `guess`."""
+        guess = guess.lower()
+        mask = self.full_mask
+        for i, (letter, ch) in enumerate(zip(guess, feedback)):
+            at_position = self.positions[i].get(letter, 0)
+            if ch.isupper():
+                mask &= at_position
+            else:
+                mask &= ~at_position
+
+        # Letter counts: every scored copy is in the word, and a '?' copy caps it
+        found = Counter(letter for letter, ch in zip(guess, feedback) if ch != '?')
+        capped = {letter for letter, ch in zip(guess, feedback) if ch == '?'}
+        for letter in set(guess):
+            mask &= self.count_mask(letter, found[letter], exact=letter in capped)
+        return mask
+
+    def candidates(self):
+        """A fresh candidate set containing every word."""
+        return CandidateSet(self)
+
+
+class CandidateSet:
+    """Live candidates for one game, narrowed incrementally as feedback arrives."""
+
+    def __init__(self, index, mask=None):
+        self.index = index
+        self.mask = index.full_mask if mask is None else mask
+        self.applied = 0
+
+    def apply(self, guess, feedback):
+        """Narrows the set with one feedback row and returns the new count."""
+        if len(guess) == self.index.word_length and len(feedback) == self.index.word_length:
+            self.mask &= self.index.constraint_mask(guess, feedback)
+        self.applied += 1
+        return len(self)
+
+    def sync(self, attempts):
+        """Applies the (guess, feedback) pairs in `attempts` not seen yet."""
+        for guess, feedback in attempts[self.applied:]:
+            self.apply(guess, feedback)
+        return len(self)
+
+    def copy(self):
+        other = CandidateSet(self.index, self.mask)
+        other.applied = self.applied
+        return other
+
+    def __len__(self):
+        return self.mask.bit_count()
+
+    def __contains__(self, word):
+        i = self.index.word_index.get(word.lower())
+        return i is not None and bool(self.mask >> i & 1)
+
+    def indices(self):
+        """Indices of the live candidates in the index's word list."""
+        return _from_bitset(self.mask, len(self.index))
+
+    def words(self):
+        return [self.index.words[i] for i in self.indices()]
+
+    def __iter__(self):
+        return iter(self.words())
@@ -0,0 +1,332 @@
+# game/event_log.py
+import argparse
+import atexit
+import fcntl
+import json
+import os
+import random
+import struct
+import threading
+import time
+
+import numpy as np
+
+from game.leword_game import MESSAGES, LeWordGame, GuessResult, message_from_code
+
+# File layout: fixed header, then fixed-width little-endian EVENT_DTYPE records.
+# A GAME_START record carries the target in `word`; a TURN record the guess.
+MAGIC = b"LWEV"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHH56x")  # magic, version, record size; 64 bytes
+STAGES = ("render", "encode", "state", "decide", "guess")
+MAX_WORD_BYTES = 32
+EVENT_DTYPE = np.dtype([
+    ("kind", "u1"),
+    ("word_length", "u1"),
+    ("turn", "<u2"),
+    ("score", "<i2"),
+    ("correct", "u1"),
+    ("max_attempts", "u1"),
+    ("message", "u1"),        # index into MESSAGES for an invalid guess, else 0
+    ("game_id", "<u8"),
+    ("pattern", "<i8"),       # feedback pattern code, -1 for an invalid guess
+    ("time", "<f8"),          # unix seconds
+    ("word", f"S{MAX_WORD_BYTES}"),
+    ("stage_ms", "<f4", (len(STAGES),)),  # NaN for stages that were not timed
+])
+GAME_START = 0
+TURN = 1
+
+# Records buffered in memory before they are written out
+DEFAULT_BUFFER_SIZE = 4096
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+
+def _create(path):
+    """Writes the header of a new log; does nothing if the log exists."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if os.path.exists(path):
+        return
+    # Link a complete header into place so no writer ever sees a log without one
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, EVENT_DTYPE.itemsize))
+    try:
+        os.link(tmp_path, path)
+    except FileExistsError:
+        pass
+    finally:
+        os.remove(tmp_path)
+
+
+def _check_header(header, path):
+    """Raises ValueError unless `header` starts an event log this version reads and writes."""
+    if len(header) != HEADER.size:
+        raise ValueError(f"{path} is not an event log.")
+    magic, version, record_size = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not an event log.")
+    if version != FORMAT_VERSION or record_size != EVENT_DTYPE.itemsize:
+        raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}.")
+
+
+class EventLogWriter:
+    """
+    Append-only game event log. Events go into a preallocated NumPy buffer and
+    are written in one append per `buffer_size` records (or after
+    `flush_interval` seconds), so logging a turn costs a few microseconds in
+    the game loop. Several processes may append to the same file: each flush
+    writes whole records with O_APPEND while holding an exclusive flock, so
+    records from different writers never interleave.
+    """
+
+    def __init__(self, path, buffer_size=DEFAULT_BUFFER_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.buffer = np.zeros(buffer_size, dtype=EVENT_DTYPE)
+        self.size = 0
+        self.lock = threading.Lock()
+        self.last_flush = time.monotonic()
+        # Random high bits keep game ids from different runs and processes apart
+        self._next_game = random.getrandbits(40) << 24
+        _create(path)
+        self.fd = os.open(path, os.O_RDWR | os.O_APPEND)
+        try:
+            self._check_and_trim()
+        except BaseException:
+            os.close(self.fd)
+            raise
+        atexit.register(self.close)
+
+    def _check_and_trim(self):
+        """
+        Refuses to append to a log of another format, and cuts off a partial
+        record left by a writer that died mid-append.
+        """
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            _check_header(os.pread(self.fd, HEADER.size, 0), self.path)
+            size = os.fstat(self.fd).st_size
+            whole = HEADER.size + max(0, size - HEADER.size) // EVENT_DTYPE.itemsize * EVENT_DTYPE.itemsize
+            if size > whole:
+                os.ftruncate(self.fd, whole)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def _append(self, kind, game_id, word, word_length, turn=0, score=0, correct=False,
+                max_attempts=0, pattern=-1, message=0, stage_ms=None):
+        with self.lock:
+            if self.size == len(self.buffer):
+                self._flush()
+            row = self.buffer[self.size]
+            row["kind"] = kind
+            row["game_id"] = game_id
+            row["word"] = word.encode("utf-8")[:MAX_WORD_BYTES]
+            row["word_length"] = word_length
+            row["turn"] = turn
+            row["score"] = score
+            row["correct"] = correct
+            row["max_attempts"] = max_attempts
+            row["pattern"] = pattern
+            row["message"] = message
+            row["time"] = time.time()
+            row["stage_ms"] = [(stage_ms or {}).get(stage, np.nan) for stage in STAGES]
+            self.size += 1
+            if time.monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def start_game(self, game):
+        """Logs a new game and returns its id for log_turn."""
+        with self.lock:
+            self._next_game += 1
+            game_id = self._next_game
+        self._append(GAME_START, game_id, game.target_word, game.word_length,
+                     max_attempts=game.max_attempts)
+        return game_id
+
+    def log_turn(self, game_id, game, result=None, stage_ms=None):
+        """
+        Logs the game's latest attempt (or `result`) with its stage timings,
+        a {stage: milliseconds} dict such as the tracer's turn spans_ms.
+        """
+        result = result if result is not None else game.attempts[-1]
+        self._append(TURN, game_id, result.guess, game.word_length, len(game.attempts), result.score or 0,
+                     result.correct, game.max_attempts, result.pattern, result.message_code, stage_ms)
+
+    def _flush(self):
+        if self.size:
+            data = memoryview(self.buffer[:self.size].tobytes())
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                while data:
+                    data = data[os.write(self.fd, data):]
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            self.size = 0
+        self.last_flush = time.monotonic()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def close(self):
+        with self.lock:
+            if self.fd is None:
+                return
+            self._flush()
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class EventLogReader:
+    """
+    Memory-mapped view of an event log. Columns are strided views over the
+    mapping (records["score"]), so scans only touch the pages they read and
+    nothing is parsed per record. A trailing partial record from an
+    interrupted write is ignored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            _check_header(f.read(HEADER.size), path)
+        n_records = (os.path.getsize(path) - HEADER.size) // EVENT_DTYPE.itemsize
+        if n_records:
+            self.records = np.memmap(path, dtype=EVENT_DTYPE, mode="r", offset=HEADER.size, shape=(n_records,))
+        else:
+            self.records = np.zeros(0, dtype=EVENT_DTYPE)
+        self._groups = None
+
+    def __len__(self):
+        return len(self.records)
+
+    def column(self, name):
+        return self.records[name]
+
+    def turns(self):
+        """The TURN records."""
+        return self.records[self.records["kind"] == TURN]
+
+    def game_ids(self):
+        return self.records["game_id"][self.records["kind"] == GAME_START]
+
+    def _grouped(self):
+        """Records sorted by game id (append order kept within a game), and where each game starts."""
+        if self._groups is None:
+            order = np.argsort(self.records["game_id"], kind="stable")
+            records = self.records[order]
+            ids, starts = np.unique(records["game_id"], return_index=True)
+            self._groups = (records, ids, np.append(starts, len(records)))
+        return self._groups
+
+    def games(self):
+        """Yields (game_id, records) for every game, sorting the log only once."""
+        records, ids, bounds = self._grouped()
+        for i, game_id in enumerate(ids):
+            yield int(game_id), records[bounds[i]:bounds[i + 1]]
+
+    def rebuild_games(self, hint=""):
+        """Yields (game_id, LeWordGame) for every game that has a GAME_START record."""
+        for game_id, rows in self.games():
+            game = _rebuild(rows, hint)
+            if game is not None:
+                yield game_id, game
+
+    def rebuild_game(self, game_id, hint=""):
+        """The LeWordGame for `game_id`, with every logged attempt replayed in."""
+        records, ids, bounds = self._grouped()
+        key = np.uint64(game_id)  # a Python int would be compared as float64
+        i = int(np.searchsorted(ids, key))
+        game = None
+        if i < len(ids) and ids[i] == key:
+            game = _rebuild(records[bounds[i]:bounds[i + 1]], hint)
+        if game is None:
+            raise KeyError(game_id)
+        return game
+
+    def summary(self):
+        """Aggregate statistics over every game in the log, computed column-wise."""
+        kind = self.records["kind"]
+        turn_mask = kind == TURN
+        game_ids = self.records["game_id"][kind == GAME_START]
+        turn_games = self.records["game_id"][turn_mask]
+        correct = self.records["correct"][turn_mask].astype(bool)
+        turn_numbers = self.records["turn"][turn_mask]
+        scores = self.records["score"][turn_mask]
+
+        won_games, first_win = np.unique(turn_games[correct], return_index=True)
+        win_turns = turn_numbers[correct][first_win]
+        distribution = np.bincount(win_turns) if win_turns.size else np.zeros(0, dtype=np.int64)
+
+        stage_ms = self.records["stage_ms"][turn_mask]
+        latency = {}
+        for i, stage in enumerate(STAGES):
+            samples = stage_ms[:, i]
+            samples = samples[~np.isnan(samples)]
+            if samples.size:
+                latency[stage] = {
+                    "count": int(samples.size),
+                    "mean_ms": float(samples.mean()),
+                    "p50_ms": float(np.percentile(samples, 50)),
+                    "p90_ms": float(np.percentile(samples, 90)),
+                    "p99_ms": float(np.percentile(samples, 99)),
+                }
+
+        return {
+            "games": int(game_ids.size),
+            "turns": int(turn_mask.sum()),
+            "wins": int(won_games.size),
+            "win_rate": won_games.size / game_ids.size if game_ids.size else 0.0,
+            "mean_guesses_when_won": float(win_turns.mean()) if win_turns.size else None,
+            "guess_distribution": {str(n): int(c) for n, c in enumerate(distribution) if c},
+            "mean_score": float(scores.mean()) if scores.size else None,
+            "latency": latency,
+        }
+
+
+def _rebuild(rows, hint):
+    """LeWordGame from one game's records, or None without a GAME_START record."""
+    starts = rows[rows["kind"] == GAME_START]
+    if not len(starts):
+        return None
+    start = starts[0]
+    game = LeWordGame(start["word"].decode("utf-8"), hint, int(start["max_attempts"]))
+    turns = rows[rows["kind"] == TURN]
+    for row in turns[np.argsort(turns["turn"], kind="stable")]:
+        game.attempts.append(GuessResult.from_pattern(
+            row["word"].decode("utf-8"), int(row["pattern"]), int(row["score"]), bool(row["correct"]),
+            message_from_code(int(row["message"]))
+        ))
+    return game
+
+
+def open_event_log(path=None, **kwargs):
+    """Writer for `path` or LEWORD_EVENT_LOG; None when neither is set."""
+    path = path or os.getenv("LEWORD_EVENT_LOG")
+    return EventLogWriter(path, **kwargs) if path else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect a LeWord game event log.")
+    parser.add_argument("path")
+    parser.add_argument("--game", type=int, help="replay this game id instead of summarizing")
+    args = parser.parse_args()
+
+    log = EventLogReader(args.path)
+    if args.game is None:
+        print(json.dumps(log.summary(), indent=2))
+        return
+    game = log.rebuild_game(args.game)
+    print(f"Target: {game.target_word}")
+    for attempt in game.attempts:
+        print(f"{attempt.guess:>{game.word_length}}  {attempt.feedback}  score={attempt.score}")
+
+
+if __name__ == "__main__":
+    main()
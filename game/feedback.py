@@ -0,0 +1,182 @@
+# game/feedback.py
+import numpy as np
+
+# Per-letter states packed into a pattern code: code = sum(state[i] * 3**i)
+ABSENT = 0    # '?'
+PRESENT = 1   # lowercase letter
+CORRECT = 2   # uppercase letter
+
+# Number of guess rows scored per chunk, keeps the (chunk, answers) temporaries
+# around a few hundred MB for a 10k word list.
+DEFAULT_CHUNK_SIZE = 1024
+
+
+def pattern_dtype(word_length):
+    """Smallest unsigned dtype able to hold every pattern code for word_length."""
+    n_patterns = 3 ** word_length
+    if n_patterns <= 2 ** 8:
+        return np.uint8
+    if n_patterns <= 2 ** 16:
+        return np.uint16
+    if n_patterns <= 2 ** 32:
+        return np.uint32
+    return np.uint64
+
+
+def encode_words(words):
+    """
+    Encodes a list of equal-length words as a (n_words, word_length) uint8 array
+    of lowercase byte values.
+    """
+    words = [word.lower() for word in words]
+    if not words:
+        return np.zeros((0, 0), dtype=np.uint8)
+    word_length = len(words[0])
+    if any(len(word) != word_length for word in words):
+        raise ValueError("All words must have the same length.")
+    data = "".join(words).encode("latin-1")
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(words), word_length).copy()
+
+
+def feedback_to_pattern(feedback):
+    """Converts a '?'/lowercase/uppercase feedback string into its pattern code."""
+    code = 0
+    for i, ch in enumerate(feedback):
+        if ch.isupper():
+            code += CORRECT * 3 ** i
+        elif ch.islower():
+            code += PRESENT * 3 ** i
+    return code
+
+
+def pattern_to_states(pattern, word_length):
+    """Unpacks a pattern code into a list of per-position states."""
+    pattern = int(pattern)
+    states = []
+    for _ in range(word_length):
+        states.append(pattern % 3)
+        pattern //= 3
+    return states
+
+
+def pattern_to_feedback(guess, pattern):
+    """Rebuilds the feedback string LeWordGame.guess would return for guess."""
+    guess = guess.lower()
+    result = []
+    for ch, state in zip(guess, pattern_to_states(pattern, len(guess))):
+        if state == CORRECT:
+            result.append(ch.upper())
+        elif state == PRESENT:
+            result.append(ch)
+        else:
+            result.append('?')
+    return ''.join(result)
+
+
+def winning_pattern(word_length):
+    """Pattern code of an all-correct guess."""
+    return (3 ** word_length - 1)
+
+
+def _letter_counts(answers):
+    """(256, n_answers) table of how many times each byte value occurs per answer."""
+    counts = np.zeros((256, answers.shape[0]), dtype=np.uint8)
+    columns = np.arange(answers.shape[0])
+    for i in range(answers.shape[1]):
+        np.add.at(counts, (answers[:, i], columns), 1)
+    return counts
+
+
+def _has_repeats(words):
+    """Boolean mask of the words that use some letter more than once."""
+    ordered = np.sort(words, axis=1)
+    return (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+
+
+def _accumulate(out, state, weight):
+    """Adds a uint8 per-position state array into the pattern codes in `out`."""
+    if out.dtype == np.uint8:
+        state *= np.uint8(weight)
+        out += state
+    else:
+        out += state.astype(out.dtype) * weight
+
+
+def _score_distinct(guesses, answers, answer_counts, out):
+    """Fast path for guesses whose letters are all different."""
+    weight = 1
+    for i in range(guesses.shape[1]):
+        # With no repeated letter in the guess, letter i is present whenever the
+        # answer contains it at all, and green adds one more on top of that.
+        state = (answer_counts[guesses[:, i]] > 0).view(np.uint8)
+        state += guesses[:, i, None] == answers[None, :, i]
+        _accumulate(out, state, weight)
+        weight *= 3
+
+
+def _score_general(guesses, answers, answer_counts, out):
+    """Scores guesses that may repeat letters, matching LeWordGame.guess."""
+    word_length = guesses.shape[1]
+    # green[g, a, i]: letter i of guess g is in the right place for answer a
+    green = guesses[:, None, :] == answers[None, :, :]
+    # same[g, i, j]: letters i and j of guess g are the same letter
+    same = guesses[:, :, None] == guesses[:, None, :]
+
+    weight = 1
+    for i in range(word_length):
+        # Copies of letter i the answer still has once greens are accounted for
+        available = answer_counts[guesses[:, i]]
+        # Earlier non-green copies of the same letter that already consumed one
+        used = np.zeros_like(available)
+        for j in range(word_length):
+            rows = same[:, i, j]
+            if not rows.any():
+                continue
+            green_j = green[:, :, j] & rows[:, None]
+            available -= green_j
+            if j < i:
+                used += rows[:, None] & ~green[:, :, j]
+        state = (used < available).view(np.uint8)
+        state &= ~green[:, :, i]
+        state += green[:, :, i] * np.uint8(CORRECT)
+        _accumulate(out, state, weight)
+        weight *= 3
+
+
+def batch_feedback(guesses, answers, chunk_size=DEFAULT_CHUNK_SIZE, out=None):
+    """
+    Scores every guess against every answer in one vectorized pass.
+
+    `guesses` and `answers` are lists of words or arrays from `encode_words`.
+    Returns a (n_guesses, n_answers) array of pattern codes with the same
+    duplicate-letter handling as LeWordGame.guess; use `pattern_to_feedback`
+    to turn a code back into a feedback string.
+    """
+    if not isinstance(guesses, np.ndarray):
+        guesses = encode_words(guesses)
+    if not isinstance(answers, np.ndarray):
+        answers = encode_words(answers)
+    if guesses.shape[1] != answers.shape[1]:
+        raise ValueError("Guesses and answers must have the same word length.")
+
+    word_length = guesses.shape[1]
+    if out is None:
+        out = np.empty((guesses.shape[0], answers.shape[0]), dtype=pattern_dtype(word_length))
+    out[...] = 0
+    answer_counts = _letter_counts(answers)
+
+    # Guesses without repeated letters skip the duplicate-letter bookkeeping
+    repeats = _has_repeats(guesses)
+    for mask, score in ((~repeats, _score_distinct), (repeats, _score_general)):
+        rows = np.flatnonzero(mask)
+        for start in range(0, rows.shape[0], chunk_size):
+            chunk = rows[start:start + chunk_size]
+            block = np.zeros((chunk.shape[0], answers.shape[0]), dtype=out.dtype)
+            score(guesses[chunk], answers, answer_counts, block)
+            out[chunk] = block
+    return out
+
+
+def feedback_pattern(guess, answer):
+    """Pattern code for a single (guess, answer) pair."""
+    return int(batch_feedback([guess], [answer])[0, 0])
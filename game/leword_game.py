@@ -1,5 +1,7 @@
+import threading
 from enum import Enum
-from dataclasses import dataclass
+from functools import lru_cache
+from game.feedback import feedback_to_pattern, pattern_to_feedback
 
 class LetterState(Enum):
     CORRECT = 1
@@ -12,19 +14,85 @@ class LetterState(Enum):
 #     states: list[LetterState]
 #     is_correct: bool
 
-@dataclass
+INVALID_LENGTH = "Invalid length of characters."
+NOT_IN_WORD_LIST = "Not in the word list."
+# Messages of rejected guesses; compact stores keep the index (0 = no message)
+MESSAGES = ("", INVALID_LENGTH, NOT_IN_WORD_LIST)
+
+def message_from_code(code):
+    """Message stored as `code` (see GuessResult.message_code); unknown codes read as INVALID_LENGTH."""
+    return MESSAGES[code] if 0 < code < len(MESSAGES) else INVALID_LENGTH
+
+@lru_cache(maxsize=8192)
+def _feedback_text(guess, pattern):
+    return pattern_to_feedback(guess, pattern)
+
+def _is_pattern(guess, feedback):
+    """True if feedback is a '?'/lowercase/uppercase row for guess, not a message."""
+    return len(feedback) == len(guess) and all(
+        ch == '?' or ch.lower() == letter for letter, ch in zip(guess.lower(), feedback)
+    )
+
 class GuessResult:
-    guess: str
-    feedback: str
-    score: int = 0
-    correct: bool = False
+    """
+    One attempt. The feedback row is kept as its pattern code (see
+    game/feedback.py); results rebuilt from a code turn it back into a string
+    on first access and keep it. Feedback that is not a pattern, such as the
+    invalid-length message, is kept as is with pattern -1.
+    """
+    __slots__ = ("guess", "pattern", "score", "correct", "_feedback")
+
+    def __init__(self, guess, feedback, score=0, correct=False):
+        self.guess = guess
+        self.score = score
+        self.correct = correct
+        self.pattern = feedback_to_pattern(feedback) if _is_pattern(guess, feedback) else -1
+        self._feedback = feedback
+
+    @classmethod
+    def from_pattern(cls, guess, pattern, score=0, correct=False, message=INVALID_LENGTH):
+        """Rebuilds a result from its stored pattern code (negative for `message`)."""
+        result = cls.__new__(cls)
+        result.guess = guess
+        result.score = score
+        result.correct = correct
+        result.pattern = pattern
+        result._feedback = message if pattern < 0 else None
+        return result
+
+    @property
+    def message_code(self):
+        """Index of a rejected guess's message in MESSAGES; 0 for scored guesses and other messages."""
+        if self.pattern < 0 and self._feedback in MESSAGES:
+            return MESSAGES.index(self._feedback)
+        return 0
+
+    @property
+    def feedback(self):
+        if self._feedback is None:
+            self._feedback = _feedback_text(self.guess, self.pattern)
+        return self._feedback
+
+    def __eq__(self, other):
+        if not isinstance(other, GuessResult):
+            return NotImplemented
+        return (self.guess, self.feedback, self.score, self.correct) == \
+            (other.guess, other.feedback, other.score, other.correct)
+
+    def __repr__(self):
+        return (f"GuessResult(guess={self.guess!r}, feedback={self.feedback!r}, "
+                f"score={self.score!r}, correct={self.correct!r})")
 
 class LeWordGame:
-    def __init__(self, target_word, hint, max_attempts=6):
+    def __init__(self, target_word, hint, max_attempts=6, lexicon=None):
         self.target_word = target_word.lower()
         self.hint = hint
         self.max_attempts = max_attempts
         self.word_length = len(target_word)
+        # Optional game.lexicon.Lexicon; guesses must then be words from it
+        self.lexicon = lexicon
+        if lexicon is not None and not lexicon.count(self.word_length):
+            raise ValueError(f"The lexicon has no words of length {self.word_length}.")
         self.attempts: list[GuessResult] = []
         self.color_map = {
             LetterState.CORRECT: (0.0, 0.6, 0.0),
@@ -32,6 +100,9 @@ class LeWordGame:
             LetterState.ABSENT: (0.3, 0.3, 0.3),
         }
         self.background_color = "black"
+        self._board = None
+        self._board_lock = threading.Lock()
+        self._live_state = None
 
     def guess(self, guess):
         from collections import Counter
@@ -40,8 +111,13 @@ class LeWordGame:
         guess = guess.lower()
 
         if len(guess) != self.word_length:
-            guess_result = GuessResult(guess, "Invalid length of characters.", False)
-            self.attempts.append(guess_result)
+            guess_result = GuessResult(guess, INVALID_LENGTH, correct=False)
+            self._record(guess_result)
+            return guess_result
+
+        if self.lexicon is not None and guess not in self.lexicon:
+            guess_result = GuessResult(guess, NOT_IN_WORD_LIST, correct=False)
+            self._record(guess_result)
             return guess_result
     
         result = ['?'] * len(guess)
@@ -64,9 +140,38 @@ class LeWordGame:
 
         guess_result = GuessResult(guess, feedback, self.calculate_score(feedback), guess == self.target_word)
         #print(f"Guess: {word}, Result: {[s.name for s in guess_result.states]}, Correct: {guess_result.is_correct}")
-        self.attempts.append(guess_result)
+        self._record(guess_result)
         return guess_result
 
+    def _record(self, guess_result):
+        with self._board_lock:
+            self.attempts.append(guess_result)
+            if self._board is not None:
+                self._board.append_result(guess_result)
+
+    @property
+    def live_state(self):
+        """Game state view that follows self.attempts without being rebuilt."""
+        if self._live_state is None:
+            from models.live_state import LiveGameState
+
+            self._live_state = LiveGameState(self)
+        return self._live_state
+
+    @property
+    def board(self):
+        """Board canvas, created on first use and then updated one row per guess."""
+        # Tools may ask for the board from several threads at once; the canvas
+        # is fully drawn before it is published
+        with self._board_lock:
+            if self._board is None:
+                from vision.board_canvas import BoardCanvas
+
+                board = BoardCanvas(self.word_length, self.max_attempts)
+                for attempt in self.attempts:
+                    board.append_result(attempt)
+                self._board = board
+            return self._board
 
     # def guess(self, word):
     #     word = word.lower()
@@ -92,7 +197,7 @@ class LeWordGame:
     #     return guess_result
 
     def is_game_over(self):
-        return len(self.attempts) >= self.max_attempts or (self.attempts and self.attempts[-1].is_correct)
+        return len(self.attempts) >= self.max_attempts or (self.attempts and self.attempts[-1].correct)
 
     def get_hint(self):
         return self.hint
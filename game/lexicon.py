@@ -0,0 +1,221 @@
+# game/lexicon.py
+import argparse
+import os
+import struct
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+# File layout: fixed header, one directory entry per word length, then for each
+# length a (count, word_length) uint8 block of sorted words followed by an
+# optional float32 weight per word. Blocks start on DATA_ALIGNMENT boundaries.
+MAGIC = b"LWLX"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHI")          # magic, version, flags, n_lengths
+ENTRY = struct.Struct("<HxxIQQ")          # word_length, count, words_offset, weights_offset (0 = none)
+FLAG_WEIGHTS = 1
+DATA_ALIGNMENT = 64
+MIN_WORD_LENGTH = 2
+MAX_WORD_LENGTH = 32
+DEFAULT_LEXICON_PATH = os.path.join(os.path.expanduser("~"), ".cache", "leword", "lexicon.bin")
+
+
+def normalize_word(word):
+    """
+    Lowercase ASCII form of `word` with accents stripped ("Citroën" ->
+    "citroen"), or None if anything but letters is left.
+    """
+    word = unicodedata.normalize("NFKD", word.strip())
+    word = "".join(ch for ch in word if not unicodedata.combining(ch)).lower()
+    if not word.isascii() or not word.isalpha():
+        return None
+    return word
+
+
+def read_word_list(path):
+    """
+    Yields (word, frequency) pairs from a text file with one word per line,
+    optionally followed by a count ("hello 12345" or "hello\t12345").
+    Frequency is None for lines without a count.
+    """
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            fields = line.split()
+            if not fields:
+                continue
+            frequency = None
+            if len(fields) > 1:
+                try:
+                    frequency = float(fields[1])
+                except ValueError:
+                    pass
+            yield fields[0], frequency
+
+
+def build_lexicon(entries, path, min_length=MIN_WORD_LENGTH, max_length=MAX_WORD_LENGTH):
+    """
+    Normalizes (word, frequency) pairs (or plain words), drops duplicates and
+    words outside [min_length, max_length], and writes the lexicon to `path`.
+    Duplicate words after normalization add up their frequencies. Weights are
+    stored when any entry has a frequency; they are normalized per length.
+    """
+    partitions = defaultdict(dict)
+    weighted = False
+    for entry in entries:
+        word, frequency = (entry, None) if isinstance(entry, str) else entry
+        word = normalize_word(word)
+        if word is None or not min_length <= len(word) <= max_length:
+            continue
+        if frequency is not None:
+            weighted = True
+        words = partitions[len(word)]
+        words[word] = words.get(word, 0.0) + (frequency or 0.0)
+
+    lengths = sorted(partitions)
+    offset = HEADER.size + ENTRY.size * len(lengths)
+    directory, blocks = [], []
+    for word_length in lengths:
+        words = sorted(partitions[word_length])
+        block = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+        words_offset = _align(offset)
+        offset = words_offset + block.nbytes
+        weights_offset = 0
+        weights = None
+        if weighted:
+            weights = np.array([partitions[word_length][w] for w in words], dtype=np.float32)
+            total = weights.sum()
+            weights = weights / total if total > 0 else np.full(len(words), 1.0 / len(words), dtype=np.float32)
+            weights_offset = _align(offset)
+            offset = weights_offset + weights.nbytes
+        directory.append(ENTRY.pack(word_length, len(words), words_offset, weights_offset))
+        blocks.append((words_offset, block))
+        if weights is not None:
+            blocks.append((weights_offset, weights.astype("<f4")))
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, FLAG_WEIGHTS if weighted else 0, len(lengths)))
+        f.write(b"".join(directory))
+        for block_offset, block in blocks:
+            f.seek(block_offset)
+            f.write(block.tobytes())
+    os.replace(tmp_path, path)
+    return path
+
+
+def _align(offset):
+    return -(-offset // DATA_ALIGNMENT) * DATA_ALIGNMENT
+
+
+class Lexicon:
+    """
+    Read-only, memory-mapped word lists partitioned by length. Opening reads
+    only the header; each length's words are decoded to strings on first use.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f"{path} is not a lexicon.")
+            magic, version, flags, n_lengths = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a lexicon.")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}.")
+            entries = [ENTRY.unpack(f.read(ENTRY.size)) for _ in range(n_lengths)]
+
+        self.weighted = bool(flags & FLAG_WEIGHTS)
+        self._data = np.memmap(path, dtype=np.uint8, mode="r") if entries else None
+        self._entries = {word_length: (count, words_offset, weights_offset)
+                         for word_length, count, words_offset, weights_offset in entries}
+        self._words = {}
+
+    def lengths(self):
+        """Word lengths present in the lexicon."""
+        return sorted(self._entries)
+
+    def count(self, word_length):
+        return self._entries[word_length][0] if word_length in self._entries else 0
+
+    def __len__(self):
+        return sum(count for count, _, _ in self._entries.values())
+
+    def encoded(self, word_length):
+        """(count, word_length) uint8 view of the words of this length, sorted."""
+        if word_length not in self._entries:
+            return np.zeros((0, word_length), dtype=np.uint8)
+        count, words_offset, _ = self._entries[word_length]
+        block = self._data[words_offset:words_offset + count * word_length]
+        return block.reshape(count, word_length)
+
+    def words(self, word_length):
+        """Sorted words of this length. The same list is returned on every call."""
+        words = self._words.get(word_length)
+        if words is None:
+            encoded = self.encoded(word_length)
+            words = encoded.view(f"S{word_length}").ravel().astype(f"U{word_length}").tolist()
+            self._words[word_length] = words
+        return words
+
+    def all_words(self):
+        return [word for word_length in self.lengths() for word in self.words(word_length)]
+
+    def weights(self, word_length):
+        """Frequency weights of this length's words (summing to 1), or None."""
+        if word_length not in self._entries:
+            return None
+        count, _, weights_offset = self._entries[word_length]
+        if not weights_offset:
+            return None
+        return self._data[weights_offset:weights_offset + 4 * count].view("<f4")
+
+    def index_of(self, word):
+        """Position of `word` in words(len(word)), or -1."""
+        word = word.lower()
+        if len(word) not in self._entries or not word.isascii():
+            return -1
+        keys = self.encoded(len(word)).view(f"S{len(word)}").ravel()
+        key = word.encode("ascii")
+        i = int(np.searchsorted(keys, key))
+        return i if i < len(keys) and keys[i] == key else -1
+
+    def __contains__(self, word):
+        return self.index_of(word) >= 0
+
+    def is_valid_guess(self, word, word_length):
+        """True if `word` has the right length and is in the lexicon."""
+        return len(word) == word_length and word in self
+
+
+def load_lexicon(path=None):
+    """
+    Opens the lexicon at `path`, LEWORD_LEXICON or the default cache path;
+    None if there is no lexicon file.
+    """
+    path = path or os.getenv("LEWORD_LEXICON") or DEFAULT_LEXICON_PATH
+    if not os.path.exists(path):
+        return None
+    return Lexicon(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a LeWord lexicon from word lists.")
+    parser.add_argument("sources", nargs="+", help="word list files, one word (and optional count) per line")
+    parser.add_argument("--output", default=DEFAULT_LEXICON_PATH)
+    parser.add_argument("--min-length", type=int, default=MIN_WORD_LENGTH)
+    parser.add_argument("--max-length", type=int, default=MAX_WORD_LENGTH)
+    args = parser.parse_args()
+
+    entries = (entry for source in args.sources for entry in read_word_list(source))
+    path = build_lexicon(entries, args.output, args.min_length, args.max_length)
+    lexicon = Lexicon(path)
+    counts = ", ".join(f"{n}: {lexicon.count(n)}" for n in lexicon.lengths())
+    print(f"Wrote {len(lexicon)} words to {path} ({counts})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+# game/multi_game.py
+import threading
+
+import numpy as np
+
+from game.feedback import batch_feedback, encode_words, winning_pattern
+from game.leword_game import INVALID_LENGTH, GuessResult, _feedback_text
+
+
+class MultiGuessResult:
+    """
+    One guess scored against every board. `patterns` holds the pattern code
+    per board; boards solved before this guess keep -1 and get no feedback.
+    """
+    __slots__ = ("guess", "patterns", "scores", "solved", "correct", "_message")
+
+    def __init__(self, guess, patterns, scores, solved, message=None):
+        self.guess = guess
+        self.patterns = patterns
+        self.scores = scores
+        self.solved = solved
+        self.correct = bool(solved.all())
+        self._message = message
+
+    @property
+    def feedback(self):
+        """Feedback string per board ("" for boards already solved), or the invalid-guess message."""
+        if self._message is not None:
+            return self._message
+        return [_feedback_text(self.guess, int(p)) if p >= 0 else "" for p in self.patterns]
+
+    @property
+    def score(self):
+        """Mean score over the boards that were still open."""
+        open_scores = self.scores[self.patterns >= 0]
+        return int(open_scores.mean()) if open_scores.size else 0
+
+    def board_result(self, board):
+        """This guess as a single-board GuessResult, or None if the board was already solved."""
+        if self._message is not None:
+            # A rejected guess leaves `solved` as it was before the guess
+            return None if self.solved[board] else GuessResult(self.guess, self._message, 0, correct=False)
+        pattern = int(self.patterns[board])
+        if pattern < 0:
+            return None
+        return GuessResult.from_pattern(self.guess, pattern, int(self.scores[board]),
+                                        pattern == winning_pattern(len(self.guess)))
+
+    def __repr__(self):
+        return (f"MultiGuessResult(guess={self.guess!r}, feedback={self.feedback!r}, "
+                f"solved={int(self.solved.sum())}/{self.solved.size})")
+
+
+class BoardState:
+    """Single-board view of a multi-target game, shaped like models.schemas.GameState."""
+    __slots__ = ("attempts", "attempts_left", "word_length")
+
+    def __init__(self, attempts, attempts_left, word_length):
+        self.attempts = attempts
+        self.attempts_left = attempts_left
+        self.word_length = word_length
+
+
+class MultiLeWordGame:
+    """
+    Quordle-style LeWord: every guess is played on all boards at once and the
+    game is won when each board's word has been found. A guess is scored
+    against all targets in one batch_feedback call; per-board completion and
+    scores are NumPy arrays, so the cost per guess barely grows with the
+    number of boards.
+    """
+
+    def __init__(self, target_words, hint, max_attempts=None):
+        self.target_words = [word.lower() for word in target_words]
+        if not self.target_words:
+            raise ValueError("A multi-target game needs at least one target word.")
+        self.targets = encode_words(self.target_words)  # raises on mixed lengths
+        self.hint = hint
+        self.n_boards = len(self.target_words)
+        self.word_length = self.targets.shape[1]
+        # Quordle gives 9 guesses for 4 boards
+        self.max_attempts = max_attempts or self.n_boards + 5
+        self.attempts: list[MultiGuessResult] = []
+        self.solved_at = np.full(self.n_boards, -1, dtype=np.int32)
+        self._win = winning_pattern(self.word_length)
+        self._powers = 3 ** np.arange(self.word_length, dtype=np.int64)
+        self._boards = None
+        self._boards_lock = threading.Lock()
+        # Per-board candidate sets the word agent narrows one guess at a time,
+        # as {id(word list): (word list, [CandidateSet per board])}
+        self.candidate_sets = {}
+
+    @property
+    def target_word(self):
+        # Tools read len(game.target_word) for the word length
+        return self.target_words[0]
+
+    @property
+    def solved(self):
+        return self.solved_at >= 0
+
+    def _rejected(self, guess, message):
+        result = MultiGuessResult(guess, np.full(self.n_boards, -1, dtype=np.int64),
+                                  np.zeros(self.n_boards, dtype=np.int64), self.solved.copy(), message=message)
+        self._record(result)
+        return result
+
+    def guess(self, guess):
+        guess = guess.lower()
+        if len(guess) != self.word_length:
+            return self._rejected(guess, INVALID_LENGTH)
+        try:
+            encoded = encode_words([guess])
+        except UnicodeEncodeError:
+            # Targets are latin-1, so such a guess could never match; reject it like a bad length
+            return self._rejected(guess, INVALID_LENGTH)
+
+        open_boards = ~self.solved
+        patterns = batch_feedback(encoded, self.targets)[0].astype(np.int64)
+        # Per-board score, the same formula as LeWordGame.calculate_score
+        states = (patterns[:, None] // self._powers) % 3
+        correct = (states == 2).sum(axis=1)
+        present = (states == 1).sum(axis=1)
+        absent = self.word_length - correct - present
+        scores = np.clip(10 * correct + 5 * present - 10 * absent, 0, 100)
+
+        self.solved_at[open_boards & (patterns == self._win)] = len(self.attempts)
+        patterns[~open_boards] = -1
+        result = MultiGuessResult(guess, patterns, scores, self.solved.copy())
+        self._record(result)
+        return result
+
+    def _record(self, result):
+        with self._boards_lock:
+            self.attempts.append(result)
+            if self._boards is not None:
+                self._boards.append_guess(result)
+
+    def board_state(self, board):
+        """Attempts that board `board` saw, for the single-board word agent."""
+        attempts = []
+        for attempt in self.attempts:
+            board_result = attempt.board_result(board)
+            if board_result is None:
+                break
+            attempts.append(board_result)
+        return BoardState(attempts, self.max_attempts - len(self.attempts), self.word_length)
+
+    @property
+    def board(self):
+        """All boards drawn side by side, created on first use and updated per guess."""
+        with self._boards_lock:
+            if self._boards is None:
+                from vision.board_canvas import BoardGrid
+
+                boards = BoardGrid(self.n_boards, self.word_length, self.max_attempts)
+                for attempt in self.attempts:
+                    boards.append_guess(attempt)
+                self._boards = boards
+            return self._boards
+
+    def is_game_over(self):
+        return len(self.attempts) >= self.max_attempts or bool(self.solved.all())
+
+    def get_hint(self):
+        return self.hint
+
+    def get_final_score(self):
+        return max(0, 100 - 10 * (len(self.attempts) - self.n_boards + 1))
+
+    def score(self):
+        return self.get_final_score()
+
+    def state(self):
+        return [(result.guess, result.feedback) for result in self.attempts]
+
+    def instructions(self):
+        return f"""
+            Let's play a multi-board word-guessing game called LeWord!
+            There are {self.n_boards} secret words, each on its own board, and every guess is played on all boards at once.
+
+            IMPORTANT:
+            - You must guess words that are EXACTLY {self.word_length} letters long.
+            - Any guess shorter or longer than {self.word_length} letters will be rejected, and you will lose an attempt.
+
+            You have {self.max_attempts} attempts to find all {self.n_boards} words.
+
+            After each guess you receive one feedback string per board, in board order, using {self.word_length} characters:
+            - An uppercase letter means that letter is correct and in the correct position.
+            - A lowercase letter means that letter is in the word but in the wrong position.
+            - A '?' means the letter is not in the word at all.
+            A board whose word you already found gets an empty string.
+
+            You win when every board is solved.
+
+            Here's your hint: {self.hint}.
+        """
+
+    def tips(self):
+        return """
+            You can use the following tools:
+            - 'guess' to make a guess on all boards
+            - 'hint' to ask for a clue
+            - 'show_board_image' to see every board
+        """
@@ -0,0 +1,232 @@
+# game/opening_book.py
+import argparse
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from game.feedback import batch_feedback, feedback_to_pattern, pattern_dtype, winning_pattern
+from game.pattern_table import word_list_hash
+
+# File layout: fixed header, the word list (newline separated), then four
+# arrays, each starting on an 8-byte boundary:
+#   node_guess   int32[n_nodes]   index of the word to play at the node
+#   node_edges   int32[n_nodes+1] node i's children are edges node_edges[i]:node_edges[i+1]
+#   edge_pattern pattern_dtype[n_edges], sorted within each node
+#   edge_child   int32[n_edges]
+# Node 0 is the opening guess.
+MAGIC = b"LWOB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIIIIB3x32s")  # magic, version, word_length, n_words, words_bytes, n_nodes, n_edges, depth, sha256
+DEFAULT_BOOK_DIR = os.path.join(os.path.expanduser("~"), ".cache", "leword", "books")
+DEFAULT_DEPTH = 3
+
+# Word list of the builder processes, set by _init_builder
+_builder = {}
+
+
+def book_path(words, book_dir=DEFAULT_BOOK_DIR):
+    """Path of the opening book for this (single-length) word list."""
+    word_length = len(words[0]) if words else 0
+    key = word_list_hash(words).hex()[:16]
+    return os.path.join(book_dir, f"book-v{FORMAT_VERSION}-{word_length}-{key}.bin")
+
+
+def _init_builder(words):
+    _builder["words"] = words
+    _builder["index"] = {word: i for i, word in enumerate(words)}
+
+
+def _subtree(candidates, played, depth, max_depth):
+    """
+    Decision tree below a position, as (guess index, {pattern: child}).
+    `candidates` are the indices of the words still consistent with the
+    feedback, `played` the indices guessed so far. The guess is the one the
+    word agent's online search would play, so book and search agree.
+    """
+    from agents.word_agent import best_guess
+
+    words = _builder["words"]
+    remaining = [words[i] for i in candidates if i not in played]
+    if not remaining:
+        return None
+    guess_pool = [word for i, word in enumerate(words) if i not in played]
+    guess = _builder["index"][best_guess(remaining, guess_pool)]
+    children = {}
+    if depth + 1 < max_depth and len(remaining) > 1:
+        patterns = batch_feedback([words[guess]], [words[i] for i in candidates])[0]
+        win = winning_pattern(len(words[guess]))
+        for pattern in np.unique(patterns):
+            if pattern == win:
+                continue
+            group = [candidates[i] for i in np.flatnonzero(patterns == pattern)]
+            child = _subtree(group, played | {guess}, depth + 1, max_depth)
+            if child is not None:
+                children[int(pattern)] = child
+    return guess, children
+
+
+def _root_child(args):
+    group, played, max_depth = args
+    return _subtree(group, played, 1, max_depth)
+
+
+def build_opening_book(words, path, depth=DEFAULT_DEPTH, workers=None):
+    """
+    Builds the decision tree for the first `depth` guesses over `words` (all
+    of one length) and writes it to `path`. The subtrees below the opening
+    guess are built in parallel, one process per core by default.
+    """
+    words = [word.lower() for word in words]
+    _init_builder(words)
+    root_guess, _ = _subtree(list(range(len(words))), frozenset(), 0, 1)
+    patterns = batch_feedback([words[root_guess]], words)[0]
+    win = winning_pattern(len(words[0]))
+    jobs = [
+        ([int(i) for i in np.flatnonzero(patterns == pattern)], frozenset({root_guess}), depth)
+        for pattern in np.unique(patterns) if pattern != win
+    ]
+    root_patterns = [int(pattern) for pattern in np.unique(patterns) if pattern != win]
+
+    if depth > 1:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_builder, initargs=(words,)) as pool:
+            subtrees = list(pool.map(_root_child, jobs))
+        children = {p: tree for p, tree in zip(root_patterns, subtrees) if tree is not None}
+    else:
+        children = {}
+    return write_opening_book(words, (root_guess, children), depth, path)
+
+
+def write_opening_book(words, tree, depth, path):
+    """Flattens a (guess, {pattern: child}) tree breadth first and writes it."""
+    node_guess, node_edges, edge_pattern, edge_child = [], [0], [], []
+    queue = [tree]
+    for guess, children in queue:  # the queue grows while it is walked
+        node_guess.append(guess)
+        for pattern in sorted(children):
+            edge_pattern.append(pattern)
+            edge_child.append(len(queue))
+            queue.append(children[pattern])
+        node_edges.append(len(edge_pattern))
+
+    word_length = len(words[0])
+    word_blob = "\n".join(words).encode("utf-8")
+    arrays = [
+        np.array(node_guess, dtype="<i4"),
+        np.array(node_edges, dtype="<i4"),
+        np.array(edge_pattern, dtype=np.dtype(pattern_dtype(word_length)).newbyteorder("<")),
+        np.array(edge_child, dtype="<i4"),
+    ]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, word_length, len(words), len(word_blob), len(node_guess),
+                            len(edge_pattern), depth, word_list_hash(words)))
+        f.write(word_blob)
+        for array in arrays:
+            f.write(b"\0" * (-f.tell() % 8))
+            f.write(array.tobytes())
+    os.replace(tmp_path, path)
+    return path
+
+
+class OpeningBook:
+    """
+    Precomputed guesses for the first moves of every game over one word list.
+    lookup() walks one edge per attempt, so it costs O(depth) small binary
+    searches; positions the book does not cover return None.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f"{path} is not an opening book.")
+            magic, version, word_length, n_words, words_bytes, n_nodes, n_edges, depth, digest = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not an opening book.")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}.")
+            self.words = f.read(words_bytes).decode("utf-8").split("\n") if n_words else []
+            offset = f.tell()
+
+        self.word_length = word_length
+        self.depth = depth
+        self.digest = digest
+        self.index = {word: i for i, word in enumerate(self.words)}
+        arrays = []
+        for dtype, count in (("<i4", n_nodes), ("<i4", n_nodes + 1),
+                             (np.dtype(pattern_dtype(word_length)).newbyteorder("<"), n_edges), ("<i4", n_edges)):
+            offset += -offset % 8
+            arrays.append(np.fromfile(path, dtype=dtype, count=count, offset=offset))
+            offset += arrays[-1].nbytes
+        self.node_guess, self.node_edges, self.edge_pattern, self.edge_child = arrays
+
+    def __len__(self):
+        return len(self.node_guess)
+
+    def lookup(self, attempts):
+        """
+        Book guess after `attempts`, a sequence of (guess, feedback) pairs
+        where feedback is a pattern code or a feedback string; None off-book.
+        """
+        node = 0
+        for guess, feedback in attempts:
+            if self.words[self.node_guess[node]] != guess.lower():
+                return None
+            pattern = feedback if isinstance(feedback, (int, np.integer)) else feedback_to_pattern(feedback)
+            start, stop = self.node_edges[node], self.node_edges[node + 1]
+            i = start + int(np.searchsorted(self.edge_pattern[start:stop], pattern))
+            if i >= stop or self.edge_pattern[i] != pattern:
+                return None
+            node = int(self.edge_child[i])
+        return self.words[self.node_guess[node]]
+
+
+def open_opening_book(words, book_dir=DEFAULT_BOOK_DIR):
+    """Opening book previously built for `words`, or None."""
+    if not words:
+        return None
+    path = book_path(words, book_dir)
+    if not os.path.exists(path):
+        return None
+    book = OpeningBook(path)
+    return book if book.digest == word_list_hash(words) else None
+
+
+def main():
+    from game.lexicon import load_lexicon
+
+    parser = argparse.ArgumentParser(description="Precompute opening books for the word agent.")
+    parser.add_argument("--words", help="word list file (default: the lexicon)")
+    parser.add_argument("--lengths", type=int, nargs="*", help="word lengths to build (default: all)")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="guesses covered by the book")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--book-dir", default=DEFAULT_BOOK_DIR)
+    args = parser.parse_args()
+
+    if args.words:
+        with open(args.words, encoding="utf-8") as f:
+            all_words = sorted({line.strip().lower() for line in f if line.strip().isalpha()})
+        partitions = {}
+        for word in all_words:
+            partitions.setdefault(len(word), []).append(word)
+    else:
+        lexicon = load_lexicon()
+        if lexicon is None:
+            parser.error("No lexicon found; pass --words or build one with python -m game.lexicon.")
+        partitions = {n: lexicon.words(n) for n in lexicon.lengths()}
+
+    for word_length in args.lengths or sorted(partitions):
+        words = partitions.get(word_length)
+        if not words:
+            continue
+        path = build_opening_book(words, book_path(words, args.book_dir), args.depth, args.workers)
+        print(f"{word_length}-letter book: {len(OpeningBook(path))} positions, {path}")
+
+
+if __name__ == "__main__":
+    main()
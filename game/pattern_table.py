@@ -0,0 +1,124 @@
+# game/pattern_table.py
+import hashlib
+import os
+import struct
+
+import numpy as np
+
+from game.feedback import batch_feedback, encode_words, pattern_dtype
+
+# File layout: fixed header, then the word list (newline separated, padded to
+# DATA_ALIGNMENT), then the (n_words, n_words) pattern matrix in C order.
+MAGIC = b"LWPT"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIQQ32s")  # magic, version, word_length, itemsize, n_words, data_offset, sha256
+DATA_ALIGNMENT = 4096
+DEFAULT_TABLE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "leword", "patterns")
+
+# Guess rows scored per batch while building, bounds peak memory.
+BUILD_BATCH_ROWS = 2048
+
+
+def word_list_hash(words):
+    """SHA-256 of the normalized word list, used to key the table on disk."""
+    digest = hashlib.sha256()
+    digest.update("\n".join(word.lower() for word in words).encode("utf-8"))
+    return digest.digest()
+
+
+def table_path(words, table_dir=DEFAULT_TABLE_DIR):
+    """Path of the pattern table for this word list."""
+    word_length = len(words[0]) if words else 0
+    key = word_list_hash(words).hex()[:16]
+    return os.path.join(table_dir, f"patterns-v{FORMAT_VERSION}-{word_length}-{key}.bin")
+
+
+def build_pattern_table(words, path):
+    """
+    Computes the guess x answer pattern matrix for `words` and writes it to `path`.
+    The file is written under a temporary name and renamed into place so readers
+    never see a partial table.
+    """
+    words = [word.lower() for word in words]
+    encoded = encode_words(words)
+    word_length = encoded.shape[1]
+    dtype = np.dtype(pattern_dtype(word_length))
+    word_blob = "\n".join(words).encode("utf-8")
+    data_offset = -(-(HEADER.size + len(word_blob)) // DATA_ALIGNMENT) * DATA_ALIGNMENT
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, word_length, dtype.itemsize,
+                            len(words), data_offset, word_list_hash(words)))
+        f.write(word_blob)
+        f.truncate(data_offset + len(words) * len(words) * dtype.itemsize)
+
+    matrix = np.memmap(tmp_path, dtype=dtype, mode="r+", offset=data_offset,
+                       shape=(len(words), len(words)))
+    for start in range(0, len(words), BUILD_BATCH_ROWS):
+        stop = min(start + BUILD_BATCH_ROWS, len(words))
+        batch_feedback(encoded[start:stop], encoded, out=matrix[start:stop])
+    matrix.flush()
+    del matrix
+    os.replace(tmp_path, path)
+    return path
+
+
+class PatternTable:
+    """
+    Read-only, memory-mapped guess x answer pattern matrix. Every process that
+    opens the same file shares one copy of it through the page cache.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f"{path} is not a pattern table.")
+            magic, version, word_length, itemsize, n_words, data_offset, digest = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a pattern table.")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}.")
+            word_blob = f.read(data_offset - HEADER.size).rstrip(b"\0")
+
+        self.words = word_blob.decode("utf-8").split("\n") if n_words else []
+        self.word_length = word_length
+        self.digest = digest
+        self.index = {word: i for i, word in enumerate(self.words)}
+        dtype = np.dtype(pattern_dtype(word_length))
+        if dtype.itemsize != itemsize:
+            raise ValueError(f"{path} stores {itemsize}-byte patterns, expected {dtype.itemsize}.")
+        self.matrix = np.memmap(path, dtype=dtype, mode="r",
+                                offset=data_offset, shape=(n_words, n_words))
+
+    def __len__(self):
+        return len(self.words)
+
+    def pattern(self, guess, answer):
+        """Pattern code for a (guess, answer) pair of words from the table."""
+        return int(self.matrix[self.index[guess.lower()], self.index[answer.lower()]])
+
+    def row(self, guess):
+        """Patterns of `guess` against every answer, as a read-only view."""
+        return self.matrix[self.index[guess.lower()]]
+
+    def indices(self, words):
+        """Row/column indices of `words` in the table."""
+        return np.fromiter((self.index[word.lower()] for word in words), dtype=np.intp)
+
+
+def open_pattern_table(words, table_dir=DEFAULT_TABLE_DIR):
+    """
+    Opens the pattern table for `words`, building it first if this word list
+    has not been seen before.
+    """
+    path = table_path(words, table_dir)
+    if os.path.exists(path):
+        table = PatternTable(path)
+        if table.digest == word_list_hash(words):
+            return table
+    build_pattern_table(words, path)
+    return PatternTable(path)
@@ -1,9 +1,7 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from io import BytesIO
 from PIL import Image
-import base64
 from game.leword_game import LetterState, GuessResult
+from vision.render_board import figure_to_array, encode_png_base64
 
 # Define a color map for tiles
 COLOR_MAP = {
@@ -15,6 +13,8 @@ BACKGROUND_COLOR = [0.1, 0.1, 0.1]  # Slightly darker than ABSENT
 
 def render_game_image(game) -> Image.Image:
     """Render the current game state as a PIL image."""
+    import matplotlib.pyplot as plt
+
     word_length = game.word_length
     max_attempts = game.max_attempts
     attempts = game.attempts
@@ -51,14 +51,14 @@ def render_game_image(game) -> Image.Image:
     ax.set_yticks([])
     plt.tight_layout()
     
-    # Convert to PIL Image
-    buf = BytesIO()
-    plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
+    # Convert to PIL Image straight from the canvas pixels
+    pixels = figure_to_array(fig)
     plt.close(fig)
-    buf.seek(0)
-    return Image.open(buf)
+    return Image.fromarray(pixels, "RGB")
 
 def render_game_state(game):
+    import matplotlib.pyplot as plt
+
     grid = np.zeros((game.max_attempts, game.word_length, 3))
     for i, attempt in enumerate(game.attempts):
         for j, state in enumerate(attempt.states):
@@ -73,16 +73,12 @@ def render_game_state(game):
             ax.text(j, i, letter.upper(), ha='center', va='center', fontsize=14, color='white')
 
     ax.axis('off')
-    buf = BytesIO()
     plt.tight_layout()
-    plt.savefig(buf, format="png", bbox_inches='tight')
-    plt.close()
-    buf.seek(0)
-    return Image.open(buf)
+    pixels = figure_to_array(fig)
+    plt.close(fig)
+    return Image.fromarray(pixels, "RGB")
 
 def as_base64_image(game):
+    # The only PNG encode on this path, the image is drawn to raw pixels
     image = render_game_state(game)
-    buffered = BytesIO()
-    image.save(buffered, format="PNG")
-    img_bytes = buffered.getvalue()
-    return f"data:image/png;base64,{base64.b64encode(img_bytes).decode()}"
\ No newline at end of file
+    return f"data:image/png;base64,{encode_png_base64(image)}"
\ No newline at end of file
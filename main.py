@@ -1,69 +1,107 @@
 import json
+import weakref
 from game.leword_game import LeWordGame
 from tools.game_tools import guess, hint, render_board, available_tools
-from agents.vision_agent import vision_agent_process_board
-from agents.word_agent import word_agent_decide_guess
-from models.schemas import GameState, GuessResult
+from agents.vision_agent import vision_agent_process_board, symbolic_agent_process_board
+from agents.word_agent import word_agent_decide_guess, game_lexicon
 from PIL import Image
 import base64
 from io import BytesIO
-from vision.render_board import render_leword_board
+from vision.render_board import render_leword_board, board_backend, board_rows
+from vision.embedding_cache import BoardEmbeddingCache
+from game.event_log import open_event_log
+from tools.tracing import tracer
 
 # Create game instance
 the_word = "subaru"
 the_hint = "Japanese car brand."
-game = LeWordGame(the_word, the_hint, 10)
+game = LeWordGame(the_word, the_hint, 10, lexicon=game_lexicon(len(the_word)))
 
 # Initialize tools
 functions = available_tools()
 
+# "clip" renders the board and embeds it, "symbolic" encodes the game state directly
+BOARD_ENCODER = "clip"
+
+# Boards are fully determined by their feedback rows, so embeddings are reused
+embedding_cache = BoardEmbeddingCache(max_entries=1024)
+
+# Every turn is appended to LEWORD_EVENT_LOG when it is set (see game/event_log.py)
+event_log = open_event_log()
+_event_game_ids = weakref.WeakKeyDictionary()
+if event_log is not None:
+    # The log records per-stage timings, which come from the tracer's spans
+    tracer.enabled = True
+
 def decode_base64_image(img_b64: str) -> Image.Image:
+    tracer.count("png_decodes")
     img_data = base64.b64decode(img_b64)
     return Image.open(BytesIO(img_data))
 
+def render_and_encode_board(game):
+    # Step 1: Render board to raw pixels, no PNG in between renderer and encoder
+    with tracer.span("render"):
+        if board_backend() == "pil":
+            # The game's canvas already holds every row, one blank row stands in for an empty board
+            board_img = game.board.array(min_rows=1)
+        elif not game.attempts:
+            dummy_board = [[' ']*len(game.target_word)]
+            board_img = render_leword_board(dummy_board, len(the_word), as_array=True)
+        else:
+            board_img = render_leword_board(board_rows(game.attempts, game.word_length), len(game.target_word), as_array=True)
+
+    with tracer.span("encode"):
+        return vision_agent_process_board(board_img)
+
 def run_turn(game):
-    # Step 1: Render board and encode image
-    if not game.attempts:
-        dummy_board = [[' ']*len(game.target_word)]
-        board_img = render_leword_board(dummy_board, len(the_word))        
+    tracer.begin_turn(target=game.target_word, turn=len(game.attempts) + 1)
+
+    # Step 1: Structured game state, a view over game.attempts rather than a rebuilt copy
+    with tracer.span("state"):
+        game_state = game.live_state
+
+    # Step 2: Encode the board, rendering it only if this board was not seen before
+    if BOARD_ENCODER == "symbolic":
+        with tracer.span("encode"):
+            vision_embedding = symbolic_agent_process_board(game_state)
     else:
-        board_img = render_leword_board([list(attempt.feedback) for attempt in game.attempts], len(game.target_word))
-
-    # Step 1: Render board and encode image
-    vision_embedding = vision_agent_process_board(board_img)
-
-    # Step 2: Create structured game state
-    game_state = GameState(
-        attempts=[
-            GuessResult(
-                guess=attempt.guess,
-                feedback=attempt.feedback,
-                correct=(attempt.guess.lower() == game.target_word.lower())
+        with tracer.span("board"):
+            vision_embedding = embedding_cache.get_or_compute(
+                [attempt.feedback for attempt in game.attempts],
+                len(game.target_word),
+                lambda: render_and_encode_board(game)
             )
-            for attempt in game.attempts
-        ],
-        attempts_left=game.max_attempts - len(game.attempts),
-        word_length=len(game.target_word)
-    )       
 
     # Step 3: Word agent decides next guess based on vision + game state
-    next_guess = word_agent_decide_guess(vision_embedding, game_state)
+    with tracer.span("decide"):
+        next_guess = word_agent_decide_guess(vision_embedding, game_state)
 
     # Step 4: Call guess tool with next_guess
-    tool_response = guess(next_guess, game=game)
+    with tracer.span("guess"):
+        tool_response = guess(next_guess, game=game)
     print(f"Guess: {next_guess}, Feedback: {tool_response}")
 
     # Step 5: Check win condition
     game_over = tool_response.get("correct", False)
 
+    turn = tracer.end_turn(guess=next_guess, feedback=tool_response["feedback"], correct=game_over)
+    if event_log is not None:
+        if game not in _event_game_ids:
+            _event_game_ids[game] = event_log.start_game(game)
+        event_log.log_turn(_event_game_ids[game], game, stage_ms=turn["spans_ms"] if turn else None)
     return game_over
 
 # Run game loop
-for turn in range(game.max_attempts):
-    print(f"Turn {turn+1}")
-    game_over = run_turn(game)
-    if game_over:
-        print("🎉 Correct word guessed! Game over.")
-        break
-else:
-    print("❌ Max attempts reached. Game over.")
+if __name__ == "__main__":
+    for turn in range(game.max_attempts):
+        print(f"Turn {turn+1}")
+        game_over = run_turn(game)
+        if game_over:
+            print("🎉 Correct word guessed! Game over.")
+            break
+    else:
+        print("❌ Max attempts reached. Game over.")
+
+    print(f"Embedding cache: {embedding_cache.stats()}")
+    if tracer.enabled:
+        print(tracer.prometheus_text())
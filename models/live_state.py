@@ -0,0 +1,38 @@
+from models.schemas import GameState, GuessResult
+
+
+class LiveGameState:
+    """
+    Lightweight stand-in for models.schemas.GameState that reads a game's
+    attempts in place, so nothing is rebuilt per turn. It has the same
+    attributes the agents use (attempts, attempts_left, word_length); the
+    pydantic model is only built, incrementally, when to_model() is called.
+    """
+    __slots__ = ("game", "_items")
+
+    def __init__(self, game):
+        self.game = game
+        self._items = []
+
+    @property
+    def attempts(self):
+        return self.game.attempts
+
+    @property
+    def attempts_left(self):
+        return self.game.max_attempts - len(self.game.attempts)
+
+    @property
+    def word_length(self):
+        return self.game.word_length
+
+    def to_model(self) -> GameState:
+        """Pydantic GameState, converting only the attempts added since the last call."""
+        for attempt in self.game.attempts[len(self._items):]:
+            self._items.append(GuessResult(guess=attempt.guess, feedback=attempt.feedback,
+                                           correct=attempt.correct))
+        return GameState(attempts=list(self._items), attempts_left=self.attempts_left,
+                         word_length=self.word_length)
+
+    def to_json(self) -> str:
+        return self.to_model().model_dump_json()
@@ -0,0 +1,246 @@
+"""
+Multi-tenant LeWord game server. Each session is a game driven through the
+guess, hint and show_board_image tools, over HTTP or a WebSocket.
+
+    python -m server.app --port 8080 --words words.txt
+
+HTTP (JSON bodies):
+    POST   /sessions                  {"target"?, "hint"?, "max_attempts"?} -> {"session_id"}
+    POST   /sessions/<id>/guess       {"guess"}
+    GET    /sessions/<id>/hint
+    GET    /sessions/<id>/board
+    DELETE /sessions/<id>
+    GET    /stats
+
+WebSocket at /ws, one JSON object per text message:
+    {"op": "new" | "guess" | "hint" | "board" | "delete", "session_id"?, ...}
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from tools.game_tools import guess, hint, show_board_image
+from agents.word_agent import all_words
+from server.http import (
+    HttpError, frame, json_body, read_frame, read_request, response, websocket_accept,
+)
+from server.session_store import MAX_ROWS, MAX_WORD_BYTES, SessionNotFound, SessionStore
+
+EXPIRY_INTERVAL = 30.0
+
+
+class GameServer:
+    def __init__(self, words=None, host="127.0.0.1", port=8080, idle_ttl=600.0, capacity=1024):
+        self.words = list(words or all_words())
+        self.host = host
+        self.port = port
+        self.store = SessionStore(capacity, idle_ttl)
+        self.server = None
+        self.expiry_task = None
+        self.requests = 0
+        self.started = time.monotonic()
+
+    # Operations shared by HTTP and WebSocket
+
+    def new_session(self, data):
+        target = data.get("target") or random.choice(self.words)
+        if not isinstance(target, str) or not (target.isascii() and target.isalpha()):
+            raise HttpError(400, "'target' must be a non-empty string of ASCII letters.")
+        if len(target.encode("utf-8")) > MAX_WORD_BYTES:
+            raise HttpError(400, f"Targets are limited to {MAX_WORD_BYTES} bytes.")
+        hint = data.get("hint", "")
+        if not isinstance(hint, str):
+            raise HttpError(400, "'hint' must be a string.")
+        max_attempts = data.get("max_attempts", 6)
+        if isinstance(max_attempts, bool) or not isinstance(max_attempts, int) or not 1 <= max_attempts <= MAX_ROWS:
+            raise HttpError(400, f"'max_attempts' must be an integer from 1 to {MAX_ROWS}.")
+        session_id = self.store.create(target, hint, max_attempts)
+        return {"session_id": session_id, "word_length": len(target)}
+
+    def guess(self, session_id, data):
+        word = data.get("guess")
+        if not isinstance(word, str) or not word:
+            raise HttpError(400, "Missing 'guess'.")
+        if len(word.encode("utf-8")) > MAX_WORD_BYTES:
+            raise HttpError(400, f"Guesses are limited to {MAX_WORD_BYTES} bytes.")
+        if self.store.is_over(session_id):
+            raise HttpError(409, "Game is over.")
+        game = self.store.game(session_id)
+        result = guess(word, game=game)
+        self.store.save(session_id, game)
+        result["attempts_left"] = game.max_attempts - len(game.attempts)
+        return result
+
+    def hint(self, session_id):
+        return {"hint": hint(self.store.game(session_id))}
+
+    def board(self, session_id):
+        return show_board_image(self.store.game(session_id))
+
+    def delete(self, session_id):
+        self.store.delete(session_id)
+        return {"deleted": session_id}
+
+    def stats(self):
+        return {
+            "sessions": len(self.store),
+            "capacity": self.store.capacity,
+            "store_bytes": self.store.memory_bytes(),
+            "requests": self.requests,
+            "uptime_s": time.monotonic() - self.started,
+        }
+
+    # HTTP
+
+    def route(self, method, path, body):
+        parts = [part for part in path.split("?", 1)[0].split("/") if part]
+        if parts == ["sessions"] and method == "POST":
+            return 201, self.new_session(json_body(body))
+        if parts == ["stats"] and method == "GET":
+            return 200, self.stats()
+        if len(parts) >= 2 and parts[0] == "sessions":
+            session_id = parts[1]
+            action = parts[2] if len(parts) > 2 else None
+            if action == "guess" and method == "POST":
+                return 200, self.guess(session_id, json_body(body))
+            if action == "hint" and method == "GET":
+                return 200, self.hint(session_id)
+            if action == "board" and method == "GET":
+                return 200, self.board(session_id)
+            if action is None and method == "DELETE":
+                return 200, self.delete(session_id)
+        raise HttpError(404, f"No route for {method} {path}")
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request, headers = None, {}
+                try:
+                    request = await read_request(reader)
+                    if request is None:
+                        break
+                    method, path, headers, body = request
+                    if path.split("?", 1)[0] == "/ws":
+                        writer.write(websocket_accept(headers))
+                        await writer.drain()
+                        await self.handle_websocket(reader, writer)
+                        break
+                    self.requests += 1
+                    status, payload = self.route(method, path, body)
+                except SessionNotFound as e:
+                    status, payload = 404, {"error": f"Unknown session {e.args[0]}"}
+                except HttpError as e:
+                    status, payload = e.status, {"error": e.message}
+                except ValueError as e:
+                    status, payload = 400, {"error": str(e)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception as e:
+                    status, payload = 500, {"error": f"Internal error: {type(e).__name__}"}
+                keep_alive = headers.get("connection", "").lower() != "close" if request else False
+                writer.write(response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    # WebSocket
+
+    def dispatch(self, message):
+        op = message.get("op")
+        session_id = message.get("session_id")
+        if op == "new":
+            return self.new_session(message)
+        if op == "guess":
+            return self.guess(session_id, message)
+        if op == "hint":
+            return self.hint(session_id)
+        if op == "board":
+            return self.board(session_id)
+        if op == "delete":
+            return self.delete(session_id)
+        raise HttpError(400, f"Unknown op {op!r}")
+
+    async def handle_websocket(self, reader, writer):
+        while True:
+            opcode, payload = await read_frame(reader)
+            if opcode == 0x8:  # close
+                writer.write(frame(b"", opcode=0x8))
+                await writer.drain()
+                return
+            if opcode == 0x9:  # ping
+                writer.write(frame(payload, opcode=0xA))
+                await writer.drain()
+                continue
+            if opcode != 0x1:
+                continue
+
+            self.requests += 1
+            message = None
+            try:
+                message = json.loads(payload)
+                reply = {"ok": True, **self.dispatch(message)}
+            except SessionNotFound as e:
+                reply = {"ok": False, "error": f"Unknown session {e.args[0]}"}
+            except HttpError as e:
+                reply = {"ok": False, "error": e.message}
+            except (ValueError, AttributeError) as e:
+                reply = {"ok": False, "error": str(e)}
+            except Exception as e:
+                reply = {"ok": False, "error": f"Internal error: {type(e).__name__}"}
+            if isinstance(message, dict) and "id" in message:
+                reply["id"] = message["id"]
+            writer.write(frame(json.dumps(reply).encode("utf-8")))
+            await writer.drain()
+
+    # Lifecycle
+
+    async def expire_idle_sessions(self):
+        while True:
+            await asyncio.sleep(EXPIRY_INTERVAL)
+            self.store.expire_idle()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port, backlog=1024)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.expiry_task = asyncio.create_task(self.expire_idle_sessions())
+        return self
+
+    async def stop(self):
+        self.expiry_task.cancel()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+
+async def _serve(args):
+    words = None
+    if args.words:
+        with open(args.words, encoding="utf-8") as f:
+            words = [line.strip().lower() for line in f if line.strip().isascii() and line.strip().isalpha()]
+    server = await GameServer(words, args.host, args.port, args.idle_ttl).start()
+    print(f"LeWord server listening on http://{server.host}:{server.port}")
+    await server.server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve LeWord games over HTTP and WebSocket.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--words", help="word list for random targets, one word per line")
+    parser.add_argument("--idle-ttl", type=float, default=600.0, help="seconds before an idle session expires")
+    asyncio.run(_serve(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# server/http.py
+import base64
+import hashlib
+import json
+import struct
+
+REASONS = {
+    101: "Switching Protocols", 200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error",
+}
+MAX_BODY_BYTES = 64 * 1024
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC11B65"
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+async def read_request(reader):
+    """Reads one HTTP/1.1 request; returns (method, path, headers, body) or None at EOF."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HttpError(400, "Malformed request line.")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        key, _, value = line.decode("latin-1").partition(":")
+        headers[key.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0) or 0)
+    if length > MAX_BODY_BYTES:
+        raise HttpError(413, "Request body too large.")
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+
+def json_body(body):
+    if not body:
+        return {}
+    try:
+        data = json.loads(body)
+    except ValueError:
+        raise HttpError(400, "Body is not valid JSON.")
+    if not isinstance(data, dict):
+        raise HttpError(400, "Body must be a JSON object.")
+    return data
+
+
+def response(status, payload, keep_alive=True):
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def websocket_accept(headers):
+    """Handshake response for a WebSocket upgrade request."""
+    key = headers.get("sec-websocket-key")
+    if headers.get("upgrade", "").lower() != "websocket" or not key:
+        raise HttpError(400, "Expected a WebSocket upgrade.")
+    accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()).decode("ascii")
+    return (
+        "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+    ).encode("latin-1")
+
+
+async def read_frame(reader):
+    """Reads one WebSocket frame; returns (opcode, payload)."""
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_BODY_BYTES:
+        raise HttpError(413, "WebSocket message too large.")
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return opcode, payload
+
+
+def frame(payload, opcode=0x1, mask=None):
+    """Encodes one unfragmented WebSocket frame (clients must pass a 4-byte mask)."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length | (0x80 if mask else 0))
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126 | (0x80 if mask else 0), length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127 | (0x80 if mask else 0), length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return header + mask + payload
+    return header + payload
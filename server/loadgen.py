@@ -0,0 +1,143 @@
+"""
+Load generator for server.app: many concurrent clients play games over
+keep-alive HTTP connections (or WebSockets with --websocket) and the run
+reports sustained requests per second and latency percentiles as JSON.
+
+    python -m server.loadgen --port 8080 --clients 200 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+import numpy as np
+
+from agents.word_agent import all_words
+from server.http import frame, read_frame
+
+
+class HttpClient:
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, payload=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            if key.strip().lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def close(self):
+        self.writer.close()
+
+
+class WebSocketClient(HttpClient):
+    async def connect(self):
+        await super().connect()
+        key = "bGV3b3JkLWxvYWRnZW4tMQ=="
+        self.writer.write(
+            f"GET /ws HTTP/1.1\r\nHost: {self.host}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode("latin-1")
+        )
+        await self.writer.drain()
+        while (await self.reader.readline()) not in (b"\r\n", b""):
+            pass
+
+    async def op(self, message):
+        self.writer.write(frame(json.dumps(message).encode("utf-8"), mask=os.urandom(4)))
+        await self.writer.drain()
+        _, payload = await read_frame(self.reader)
+        reply = json.loads(payload)
+        return (200 if reply.get("ok") else 400), reply
+
+
+async def _play(client, words, use_websocket, latencies, errors):
+    """Plays one game: new session, a hint, guesses until over, one board render."""
+    async def call(method, path, payload=None, op=None):
+        started = time.perf_counter()
+        if use_websocket:
+            status, reply = await client.op({"op": op, **(payload or {})})
+        else:
+            status, reply = await client.request(method, path, payload)
+        latencies.append(time.perf_counter() - started)
+        if status >= 400:
+            errors.append(status)
+        return reply
+
+    created = await call("POST", "/sessions", {"target": random.choice(words)}, op="new")
+    session_id = created["session_id"]
+    base = f"/sessions/{session_id}"
+    await call("GET", f"{base}/hint", {"session_id": session_id}, op="hint")
+    for word in random.sample(words, min(6, len(words))):
+        result = await call("POST", f"{base}/guess", {"session_id": session_id, "guess": word}, op="guess")
+        if result.get("correct") or result.get("attempts_left", 1) <= 0:
+            break
+    await call("GET", f"{base}/board", {"session_id": session_id}, op="board")
+
+
+async def run_load(host, port, clients, duration, words, use_websocket=False):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        client = (WebSocketClient if use_websocket else HttpClient)(host, port)
+        await client.connect()
+        try:
+            while time.perf_counter() < deadline:
+                await _play(client, words, use_websocket, latencies, errors)
+        finally:
+            await client.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    ms = np.array(latencies) * 1000.0
+    return {
+        "clients": clients,
+        "transport": "websocket" if use_websocket else "http",
+        "requests": len(latencies),
+        "errors": len(errors),
+        "elapsed_s": elapsed,
+        "requests_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": float(np.percentile(ms, 50)) if ms.size else None,
+            "p95": float(np.percentile(ms, 95)) if ms.size else None,
+            "p99": float(np.percentile(ms, 99)) if ms.size else None,
+            "max": float(ms.max()) if ms.size else None,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate load against the LeWord game server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--websocket", action="store_true", help="play over /ws instead of HTTP")
+    args = parser.parse_args()
+    summary = asyncio.run(run_load(args.host, args.port, args.clients, args.duration,
+                                   all_words(), args.websocket))
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
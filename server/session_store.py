@@ -0,0 +1,159 @@
+# server/session_store.py
+import secrets
+import time
+
+import numpy as np
+
+from game.leword_game import LeWordGame, GuessResult, message_from_code
+
+# Longest guess/target stored; longer guesses are rejected by the server
+MAX_WORD_BYTES = 32
+# Attempts stored per session; max_attempts is capped to this
+MAX_ROWS = 16
+
+
+class SessionNotFound(KeyError):
+    pass
+
+
+class SessionStore:
+    """
+    Struct-of-arrays store for many concurrent games. Each session is one slot
+    (row) in a set of NumPy columns, so thousands of idle games cost a few
+    hundred bytes each instead of a LeWordGame object graph. A LeWordGame is
+    materialized from a slot only while a request is being served.
+
+    Session ids are "<slot>-<token>"; the random token is checked on every
+    lookup so ids of expired sessions are never reused.
+    """
+
+    def __init__(self, capacity=1024, idle_ttl=600.0):
+        self.idle_ttl = idle_ttl
+        self.capacity = 0
+        self.free = []
+        self.live = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        def extend(column, shape, dtype, fill=0):
+            grown = np.full((capacity,) + shape, fill, dtype=dtype)
+            if column is not None:
+                grown[:len(column)] = column
+            return grown
+
+        old = self.capacity
+        self.token = extend(getattr(self, "token", None), (), np.uint64)
+        self.alive = extend(getattr(self, "alive", None), (), np.bool_)
+        self.target = extend(getattr(self, "target", None), (), f"S{MAX_WORD_BYTES}", b"")
+        self.max_attempts = extend(getattr(self, "max_attempts", None), (), np.uint8)
+        self.n_attempts = extend(getattr(self, "n_attempts", None), (), np.uint8)
+        self.last_access = extend(getattr(self, "last_access", None), (), np.float64)
+        self.guesses = extend(getattr(self, "guesses", None), (MAX_ROWS,), f"S{MAX_WORD_BYTES}", b"")
+        # int64 holds the pattern code of any word up to MAX_WORD_BYTES letters (3**32 < 2**63)
+        self.patterns = extend(getattr(self, "patterns", None), (MAX_ROWS,), np.int64, -1)
+        self.scores = extend(getattr(self, "scores", None), (MAX_ROWS,), np.int16)
+        self.correct = extend(getattr(self, "correct", None), (MAX_ROWS,), np.bool_)
+        # Rejected guesses keep their message as a game.leword_game.MESSAGES index
+        self.messages = extend(getattr(self, "messages", None), (MAX_ROWS,), np.uint8)
+        hints = getattr(self, "hints", [])
+        self.hints = hints + [None] * (capacity - len(hints))
+        self.capacity = capacity
+        # Pop from the end, so hand out low slots first
+        self.free.extend(range(capacity - 1, old - 1, -1))
+
+    def __len__(self):
+        return self.live
+
+    def create(self, target, hint="", max_attempts=6):
+        """Starts a new game and returns its session id."""
+        target = target.lower()
+        # Pattern codes need targets whose letters keep their length when uppercased
+        if not (target.isascii() and target.isalpha()):
+            raise ValueError("Target words must be ASCII letters.")
+        if len(target.encode("utf-8")) > MAX_WORD_BYTES:
+            raise ValueError(f"Target words are limited to {MAX_WORD_BYTES} bytes.")
+        if not self.free:
+            self._grow(2 * self.capacity)
+        slot = self.free.pop()
+        token = secrets.randbits(63)
+
+        self.token[slot] = token
+        self.alive[slot] = True
+        self.target[slot] = target.encode("utf-8")
+        self.hints[slot] = hint
+        self.max_attempts[slot] = min(max_attempts, MAX_ROWS)
+        self.n_attempts[slot] = 0
+        self.guesses[slot] = b""
+        self.patterns[slot] = -1
+        self.scores[slot] = 0
+        self.correct[slot] = False
+        self.messages[slot] = 0
+        self.last_access[slot] = time.monotonic()
+        self.live += 1
+        return f"{slot}-{token:x}"
+
+    def slot(self, session_id):
+        """Slot of a live session, refreshing its idle timer."""
+        try:
+            slot_text, token_text = session_id.split("-", 1)
+            slot, token = int(slot_text), int(token_text, 16)
+        except (AttributeError, ValueError):
+            raise SessionNotFound(session_id)
+        if not (0 <= slot < self.capacity) or not self.alive[slot] or int(self.token[slot]) != token:
+            raise SessionNotFound(session_id)
+        self.last_access[slot] = time.monotonic()
+        return slot
+
+    def game(self, session_id):
+        """Materializes the session as a LeWordGame for the tools to act on."""
+        slot = self.slot(session_id)
+        game = LeWordGame(self.target[slot].decode("utf-8"), self.hints[slot], int(self.max_attempts[slot]))
+        for row in range(int(self.n_attempts[slot])):
+            game.attempts.append(GuessResult.from_pattern(
+                self.guesses[slot, row].decode("utf-8"), int(self.patterns[slot, row]),
+                int(self.scores[slot, row]), bool(self.correct[slot, row]),
+                message_from_code(int(self.messages[slot, row]))
+            ))
+        return game
+
+    def is_over(self, session_id):
+        slot = self.slot(session_id)
+        n = int(self.n_attempts[slot])
+        return n >= int(self.max_attempts[slot]) or (n > 0 and bool(self.correct[slot, n - 1]))
+
+    def save(self, session_id, game):
+        """Writes the attempts `game` made since it was materialized back to the store."""
+        slot = self.slot(session_id)
+        for row in range(int(self.n_attempts[slot]), min(len(game.attempts), MAX_ROWS)):
+            attempt = game.attempts[row]
+            self.guesses[slot, row] = attempt.guess.encode("utf-8")[:MAX_WORD_BYTES]
+            self.patterns[slot, row] = attempt.pattern
+            self.scores[slot, row] = int(attempt.score)
+            self.correct[slot, row] = attempt.correct
+            self.messages[slot, row] = attempt.message_code
+            self.n_attempts[slot] = row + 1
+
+    def delete(self, session_id):
+        self._release(self.slot(session_id))
+
+    def _release(self, slot):
+        self.alive[slot] = False
+        self.token[slot] = 0
+        self.hints[slot] = None
+        self.free.append(slot)
+        self.live -= 1
+
+    def expire_idle(self, now=None):
+        """Drops sessions idle for longer than idle_ttl; returns how many."""
+        now = time.monotonic() if now is None else now
+        expired = np.flatnonzero(self.alive & (self.last_access < now - self.idle_ttl))
+        for slot in expired:
+            self._release(int(slot))
+        return len(expired)
+
+    def memory_bytes(self):
+        """Bytes held by the array columns."""
+        return sum(column.nbytes for column in (
+            self.token, self.alive, self.target, self.max_attempts, self.n_attempts,
+            self.last_access, self.guesses, self.patterns, self.scores, self.correct, self.messages,
+        ))
@@ -0,0 +1,73 @@
+# tests/test_batching.py
+import threading
+
+import numpy as np
+
+from vision.batching import BatchingEncoder
+
+
+def _encode_batch(images):
+    return np.array([[float(image)] for image in images])
+
+
+def test_stop_before_start_is_a_noop():
+    encoder = BatchingEncoder(_encode_batch)
+    encoder.stop()
+    assert encoder.thread is None
+    assert encoder.encode(3, timeout=5)[0] == 3.0
+    encoder.stop()
+
+
+def test_concurrent_requests_share_a_batch():
+    encoder = BatchingEncoder(_encode_batch, max_batch_size=8, max_wait_ms=200.0)
+    barrier = threading.Barrier(8)
+    results = {}
+
+    def caller(i):
+        barrier.wait()
+        results[i] = encoder.encode(i, timeout=5)[0]
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    encoder.stop()
+
+    assert results == {i: float(i) for i in range(8)}
+    stats = encoder.stats()
+    assert stats["images"] == 8
+    assert stats["batches"] < 8
+
+
+def test_submit_racing_stop_always_resolves():
+    encoder = BatchingEncoder(_encode_batch, max_wait_ms=0.0)
+    futures = []
+
+    def submitter():
+        for i in range(200):
+            futures.append(encoder.submit(i))
+
+    thread = threading.Thread(target=submitter)
+    thread.start()
+    for _ in range(50):
+        encoder.stop()
+    thread.join()
+    encoder.stop()
+    # Requests queued after a stop restart the worker instead of being stranded
+    assert [future.result(timeout=5)[0] for future in futures] == [float(i) for i in range(200)]
+
+
+def test_encode_errors_reach_every_caller():
+    def broken(images):
+        raise RuntimeError("model unavailable")
+
+    encoder = BatchingEncoder(broken)
+    future = encoder.submit(1)
+    try:
+        future.result(timeout=5)
+    except RuntimeError as e:
+        assert str(e) == "model unavailable"
+    else:
+        raise AssertionError("expected the encode error")
+    encoder.stop()
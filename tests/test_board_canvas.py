@@ -0,0 +1,35 @@
+# tests/test_board_canvas.py
+import numpy as np
+
+from game.leword_game import LeWordGame
+from game.multi_game import MultiLeWordGame
+from vision.fast_render import render_board_array
+from vision.render_board import board_rows
+
+
+def test_rejected_guess_draws_blank_row():
+    game = LeWordGame("apple", "")
+    game.board  # draw incrementally from the first guess
+    for guess in ("app", "grape", "apples"):
+        game.guess(guess)
+    expected = render_board_array(["     ", "??apE", "     "], 5)
+    assert np.array_equal(game.board.array(), expected)
+    assert np.array_equal(render_board_array(board_rows(game.attempts, 5), 5), expected)
+
+
+def test_board_replayed_after_guesses_matches_incremental():
+    game = LeWordGame("apple", "")
+    for guess in ("grape", "in", "apple"):
+        game.guess(guess)
+    assert np.array_equal(game.board.array(), render_board_array(["??apE", "     ", "APPLE"], 5))
+
+
+def test_multi_board_rejected_guess_draws_blank_rows():
+    game = MultiLeWordGame(["apple", "grape"], "")
+    game.guess("apple")
+    game.guess("too long")
+    grid = game.board.array()
+    solved, open_board = np.hsplit(grid, 2)
+    # The solved board is padded with empty tiles below its last row
+    assert np.array_equal(solved, render_board_array(["APPLE", "     "], 5))
+    assert np.array_equal(open_board, render_board_array([game.attempts[0].feedback[1], "     "], 5))
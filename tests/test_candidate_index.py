@@ -0,0 +1,36 @@
+# tests/test_candidate_index.py
+import random
+
+from game.candidate_index import CandidateIndex
+from game.leword_game import LeWordGame
+
+
+def brute_force(words, attempts):
+    return [
+        word for word in words
+        if all(LeWordGame(word, "").guess(guess).feedback == feedback for guess, feedback in attempts)
+    ]
+
+
+def test_filtering_matches_brute_force():
+    rng = random.Random(4)
+    words = sorted({"".join(rng.choice("aabcdeelst") for _ in range(5)) for _ in range(400)})
+    index = CandidateIndex(words)
+    for _ in range(50):
+        target = rng.choice(words)
+        game = LeWordGame(target, "")
+        candidates = index.candidates()
+        for guess in rng.sample(words, 4):
+            game.guess(guess)
+            candidates.sync(game.state())
+            assert candidates.words() == brute_force(words, game.state())
+            assert target in candidates
+
+
+def test_duplicate_letter_caps():
+    index = CandidateIndex(["eerie", "there", "three", "fleet", "sheep", "eight"])
+    feedback = LeWordGame("there", "").guess("geese").feedback
+    candidates = index.candidates()
+    candidates.apply("geese", feedback)
+    assert candidates.words() == brute_force(index.words, [("geese", feedback)])
+    assert "there" in candidates
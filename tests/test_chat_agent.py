@@ -0,0 +1,69 @@
+# tests/test_chat_agent.py
+import asyncio
+import random
+
+import openai
+import pytest
+
+import agents.word_agent as word_agent
+from agents.chat_agent import AsyncChatAgent, play_chat_game
+from agents.mock_chat_server import MockChatServer
+from game.leword_game import LeWordGame
+from tools.game_tools import available_tools, guess, hint, show_board_image
+
+TOOLS = {"guess": guess, "hint": hint, "show_board_image": show_board_image}
+
+
+@pytest.fixture(autouse=True)
+def built_in_words(monkeypatch):
+    # The stand-in server plays the word agent; keep it off the user's lexicon and books
+    monkeypatch.setattr(word_agent, "LEXICON", None)
+    monkeypatch.setattr(word_agent, "_opening_book", lambda words, word_length: None)
+
+
+async def play_games(targets, server_options, agent_options, parallel_tools=True):
+    async with MockChatServer(**server_options) as server:
+        async with AsyncChatAgent(base_url=server.base_url, api_key="test", **agent_options) as agent:
+            games = [LeWordGame(target, "car", 6) for target in targets]
+            won = await asyncio.gather(*(
+                play_chat_game(agent, game, available_tools(), TOOLS, parallel_tools=parallel_tools)
+                for game in games
+            ))
+    return won, games, server, agent
+
+
+@pytest.mark.parametrize("parallel_tools", [True, False])
+def test_agent_plays_games_against_stand_in(parallel_tools):
+    targets = ["mazda", "honda", "lexus", "toyota", "subaru", "nissan"]
+    won, games, server, agent = asyncio.run(play_games(targets, {}, {}, parallel_tools))
+    assert all(won)
+    assert all(game.attempts[-1].guess == target for game, target in zip(games, targets))
+    assert agent.requests == server.requests
+
+
+def test_failed_requests_are_retried():
+    random.seed(3)
+    won, games, server, agent = asyncio.run(play_games(
+        ["mazda", "suzuki", "datsun"], {"error_rate": 0.3}, {"max_retries": 10, "backoff": 0.001},
+    ))
+    assert all(won)
+    assert server.errors > 0
+    assert agent.retries == server.errors
+    assert agent.requests == server.requests
+
+
+def test_gives_up_after_max_retries():
+    with pytest.raises(openai.InternalServerError):
+        asyncio.run(play_games(["mazda"], {"error_rate": 1.0}, {"max_retries": 2, "backoff": 0.001}))
+
+
+def test_timeouts_are_retried_then_raised():
+    async def run():
+        async with MockChatServer(latency_ms=500) as server:
+            async with AsyncChatAgent(base_url=server.base_url, api_key="test", timeout=0.05,
+                                      max_retries=1, backoff=0.001) as agent:
+                with pytest.raises(openai.APITimeoutError):
+                    await agent.ask([{"role": "user", "content": "hi"}], available_tools())
+                return agent.requests, agent.retries
+
+    assert asyncio.run(run()) == (2, 1)
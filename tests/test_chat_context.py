@@ -0,0 +1,75 @@
+# tests/test_chat_context.py
+import json
+
+from agents.chat_context import IMAGE_PLACEHOLDER, SUMMARY_MARKER, ChatContext
+from agents.tool_dispatcher import ToolCall, ToolDispatcher, tool_messages
+from game.leword_game import LeWordGame
+from tools.game_tools import guess, hint, show_board_image
+
+TOOLS = {"guess": guess, "hint": hint, "show_board_image": show_board_image}
+
+
+def play_turn(context, dispatcher, game, turn, word):
+    calls = [
+        ToolCall(f"call_{turn}_board", "show_board_image", "{}"),
+        ToolCall(f"call_{turn}_guess", "guess", json.dumps({"guess": word})),
+    ]
+    if turn == 0:
+        calls.insert(0, ToolCall("call_0_hint", "hint", "{}"))
+    context.add_turn(*tool_messages(calls, dispatcher.dispatch(calls, game)))
+
+
+def assert_tool_results_follow_their_calls(messages):
+    pending = set()
+    for message in messages:
+        if message["role"] == "assistant":
+            assert not pending
+            pending = {call["id"] for call in message.get("tool_calls") or ()}
+        elif message["role"] == "tool":
+            pending.remove(message["tool_call_id"])
+    assert not pending
+
+
+def test_compaction_keeps_system_summary_and_recent_turns():
+    game = LeWordGame("lexus", "car", 8)
+    context = ChatContext(game, keep_turns=2, token_budget=100_000)
+    system = context.build()
+    counts = []
+    with ToolDispatcher(TOOLS, max_workers=2) as dispatcher:
+        for turn, word in enumerate(["mazda", "honda", "acura", "buick", "tesla", "lexus"]):
+            play_turn(context, dispatcher, game, turn, word)
+            messages = context.build()
+            counts.append(len(messages))
+
+            # The system prompt is sent unchanged, then the summary of every attempt
+            assert messages[:len(system)] == system
+            summary = messages[len(system)]
+            assert summary["role"] == "user" and summary["content"].startswith(SUMMARY_MARKER)
+            state = json.loads(summary["content"][len(SUMMARY_MARKER):])
+            assert [a["guess"] for a in state["attempts"]] == [a.guess for a in game.attempts]
+            assert "car" in state["hint"]
+
+            # The newest turns are sent whole, with only the newest board image
+            recent = messages[len(system) + 1:]
+            assert_tool_results_follow_their_calls(recent)
+            assert [m for m in recent if m["role"] == "assistant"] == \
+                [turn_messages[0] for turn_messages in context.turns[-2:]]
+            images = [json.loads(m["content"])["image_base64"] for m in recent
+                      if m["role"] == "tool" and "image_base64" in m["content"]]
+            assert images[-1] != IMAGE_PLACEHOLDER
+            assert all(image == IMAGE_PLACEHOLDER for image in images[:-1])
+
+    # The number of messages sent stays flat as the game goes on
+    assert len(set(counts[2:])) == 1
+
+
+def test_token_budget_drops_whole_turns():
+    game = LeWordGame("lexus", "car", 8)
+    context = ChatContext(game, keep_turns=4, token_budget=1)
+    with ToolDispatcher(TOOLS, max_workers=2) as dispatcher:
+        for turn, word in enumerate(["mazda", "honda", "acura"]):
+            play_turn(context, dispatcher, game, turn, word)
+    messages = context.build()
+    # Over budget, only the system prompt and the summary are left
+    assert [m["role"] for m in messages] == ["system", "user"]
+    assert_tool_results_follow_their_calls(messages)
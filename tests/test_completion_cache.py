@@ -0,0 +1,86 @@
+# tests/test_completion_cache.py
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from agents.completion_cache import CompletionCache, CompletionCacheMiss, request_key
+
+FUNCTIONS = [{"name": "guess", "parameters": {"type": "object", "properties": {"guess": {"type": "string"}}}}]
+
+
+def completion(text):
+    from openai.types.chat import ChatCompletion
+
+    return ChatCompletion.model_validate({
+        "id": f"chatcmpl-{text}",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "function_call",
+            "message": {"role": "assistant", "content": None,
+                        "function_call": {"name": "guess", "arguments": json.dumps({"guess": text})}},
+        }],
+    })
+
+
+def messages(n):
+    return [{"role": "system", "content": "Play LeWord."}, {"role": "user", "content": f"turn {n}"}]
+
+
+def test_record_then_replay(tmp_path):
+    cache = CompletionCache(str(tmp_path), "record")
+    key, response = cache.lookup("gpt-4o", messages(1), FUNCTIONS)
+    assert response is None
+    cache.record(key, completion("mazda"))
+
+    # Key order in the request does not matter
+    reordered = [{"content": m["content"], "role": m["role"]} for m in messages(1)]
+    assert request_key("gpt-4o", reordered, FUNCTIONS) == key
+
+    replay = CompletionCache(str(tmp_path), "strict")
+    _, response = replay.lookup("gpt-4o", reordered, FUNCTIONS)
+    assert response == completion("mazda")
+    with pytest.raises(CompletionCacheMiss):
+        replay.lookup("gpt-4o", messages(2), FUNCTIONS)
+
+
+def test_torn_record_is_dropped(tmp_path):
+    cache = CompletionCache(str(tmp_path))
+    for n in range(3):
+        cache.record(request_key("gpt-4o", messages(n), FUNCTIONS), completion(f"w{n}"))
+    with open(os.path.join(tmp_path, "completions.dat"), "ab") as f:
+        f.write(b"LWCC" + b"\0" * 10)
+    os.remove(os.path.join(tmp_path, "completions.idx"))
+
+    reopened = CompletionCache(str(tmp_path), "strict")
+    assert len(reopened) == 3
+    for n in range(3):
+        assert reopened.lookup("gpt-4o", messages(n), FUNCTIONS)[1] == completion(f"w{n}")
+
+
+def _record_many(cache_dir, worker, count):
+    cache = CompletionCache(cache_dir)
+    for n in range(count):
+        cache.record(request_key("gpt-4o", messages(f"{worker}-{n}"), FUNCTIONS), completion(f"{worker}x{n}"))
+
+
+def test_processes_share_a_cache(tmp_path):
+    cache_dir = str(tmp_path)
+    reader = CompletionCache(cache_dir, "strict")
+    workers = [multiprocessing.Process(target=_record_many, args=(cache_dir, w, 50)) for w in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+        assert process.exitcode == 0
+
+    # An open cache sees records made by other processes, and so does a fresh one
+    for cache in (reader, CompletionCache(cache_dir, "strict")):
+        for w in range(4):
+            for n in range(50):
+                _, response = cache.lookup("gpt-4o", messages(f"{w}-{n}"), FUNCTIONS)
+                assert response == completion(f"{w}x{n}")
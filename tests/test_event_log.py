@@ -0,0 +1,81 @@
+# tests/test_event_log.py
+import os
+
+import numpy as np
+import pytest
+
+from game.event_log import EVENT_DTYPE, HEADER, MAGIC, EventLogReader, EventLogWriter
+from game.leword_game import LeWordGame
+from game.lexicon import Lexicon, build_lexicon
+
+
+@pytest.fixture
+def lexicon(tmp_path):
+    return Lexicon(build_lexicon(["apple", "grape", "lemon", "melon", "peach"], str(tmp_path / "lexicon.bin")))
+
+
+def play(writer, lexicon, target, guesses):
+    game = LeWordGame(target, "", 6, lexicon=lexicon)
+    game_id = writer.start_game(game)
+    for guess in guesses:
+        game.guess(guess)
+        writer.log_turn(game_id, game, stage_ms={"decide": 1.5})
+    return game_id, game
+
+
+def test_round_trip(tmp_path, lexicon):
+    path = str(tmp_path / "events.bin")
+    with EventLogWriter(path, buffer_size=3) as writer:
+        games = dict([
+            play(writer, lexicon, "apple", ["grape", "zzzzz", "app", "apple"]),
+            play(writer, lexicon, "melon", ["lemon", "peach"]),
+            play(writer, lexicon, "peach", ["peach"]),
+        ])
+
+    log = EventLogReader(path)
+    rebuilt = dict(log.rebuild_games())
+    assert rebuilt.keys() == games.keys()
+    for game_id, game in games.items():
+        assert rebuilt[game_id].state() == game.state()
+        assert log.rebuild_game(game_id).state() == game.state()
+    # Rejected guesses keep their own message
+    apple = next(game for game in rebuilt.values() if game.target_word == "apple")
+    assert [feedback for _, feedback in apple.state()[1:3]] == ["Not in the word list.", "Invalid length of characters."]
+
+    summary = log.summary()
+    assert summary["games"] == 3 and summary["turns"] == 7 and summary["wins"] == 2
+    assert summary["latency"]["decide"]["count"] == 7
+    with pytest.raises(KeyError):
+        log.rebuild_game(12345)
+
+
+def test_torn_trailing_record(tmp_path, lexicon):
+    path = str(tmp_path / "events.bin")
+    with EventLogWriter(path) as writer:
+        first_id, first = play(writer, lexicon, "apple", ["grape"])
+    with open(path, "ab") as f:
+        f.write(b"\x01" * (EVENT_DTYPE.itemsize // 2))
+
+    # Readers skip the partial record, the next writer cuts it off
+    assert len(EventLogReader(path)) == 2
+    with EventLogWriter(path) as writer:
+        second_id, second = play(writer, lexicon, "lemon", ["melon", "lemon"])
+    assert (os.path.getsize(path) - HEADER.size) % EVENT_DTYPE.itemsize == 0
+    rebuilt = dict(EventLogReader(path).rebuild_games())
+    assert rebuilt[first_id].state() == first.state()
+    assert rebuilt[second_id].state() == second.state()
+
+
+def test_writer_refuses_other_format(tmp_path):
+    path = str(tmp_path / "events.bin")
+    old_size = EVENT_DTYPE.itemsize - 1
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, 1, old_size))
+        f.write(np.zeros(3 * old_size, dtype=np.uint8).tobytes())
+    size = os.path.getsize(path)
+
+    with pytest.raises(ValueError):
+        EventLogWriter(path)
+    with pytest.raises(ValueError):
+        EventLogReader(path)
+    assert os.path.getsize(path) == size
@@ -0,0 +1,48 @@
+# tests/test_feedback.py
+import random
+
+import pytest
+
+from game.feedback import batch_feedback, feedback_pattern, pattern_to_feedback, winning_pattern
+from game.leword_game import LeWordGame
+
+
+def game_feedback(guess, answer):
+    return LeWordGame(answer, "").guess(guess).feedback
+
+
+def random_words(n, word_length, alphabet, seed):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(word_length)) for _ in range(n)]
+
+
+@pytest.mark.parametrize("guess, answer", [
+    ("apple", "grape"),
+    ("speed", "abide"),
+    ("eerie", "there"),
+    ("llama", "hello"),
+    ("geese", "eerie"),
+    ("aaaaa", "abaca"),
+    ("abbey", "babes"),
+])
+def test_duplicate_letters_match_game(guess, answer):
+    assert pattern_to_feedback(guess, feedback_pattern(guess, answer)) == game_feedback(guess, answer)
+
+
+@pytest.mark.parametrize("word_length", [3, 5, 8])
+def test_batch_feedback_matches_game(word_length):
+    # A small alphabet makes repeated letters common
+    guesses = random_words(40, word_length, "abcdef", seed=word_length)
+    answers = random_words(60, word_length, "abcdef", seed=word_length + 100)
+    patterns = batch_feedback(guesses, answers, chunk_size=7)
+    assert patterns.shape == (len(guesses), len(answers))
+    for i, guess in enumerate(guesses):
+        for j, answer in enumerate(answers):
+            assert pattern_to_feedback(guess, int(patterns[i, j])) == game_feedback(guess, answer)
+
+
+def test_game_pattern_round_trips():
+    for guess, answer in zip(random_words(200, 5, "aeiourst", 1), random_words(200, 5, "aeiourst", 2)):
+        result = LeWordGame(answer, "").guess(guess)
+        assert result.pattern == feedback_pattern(guess, answer)
+        assert (result.pattern == winning_pattern(5)) == (guess == answer)
@@ -0,0 +1,20 @@
+# tests/test_guess_result.py
+from game.leword_game import INVALID_LENGTH, GuessResult, LeWordGame
+
+
+def test_rejected_guess_scores_zero():
+    result = LeWordGame("apple", "").guess("app")
+    assert result.feedback == INVALID_LENGTH and result.pattern == -1
+    assert result.score == 0 and result.score is not False
+    assert result.correct is False
+
+
+def test_restored_result_matches_original():
+    game = LeWordGame("apple", "")
+    for guess in ("grape", "pleat", "apple"):
+        original = game.guess(guess)
+        restored = GuessResult.from_pattern(original.guess, original.pattern, original.score, original.correct)
+        assert restored == original
+        # The feedback string is built once and then kept
+        assert restored.feedback is restored.feedback
+    assert GuessResult.from_pattern("app", -1).feedback == INVALID_LENGTH
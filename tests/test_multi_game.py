@@ -0,0 +1,52 @@
+# tests/test_multi_game.py
+import numpy as np
+
+from game.leword_game import INVALID_LENGTH, LeWordGame
+from game.multi_game import MultiLeWordGame
+
+
+def test_multi_game_matches_single_boards():
+    targets = ["eerie", "there", "speed", "geese"]
+    multi = MultiLeWordGame(targets, "")
+    singles = [LeWordGame(target, "", multi.max_attempts) for target in targets]
+    for guess in ["apple", "eerie", "theme", "speed", "geese", "there"]:
+        result = multi.guess(guess)
+        for board, single in enumerate(singles):
+            solved = bool(single.attempts) and single.attempts[-1].correct
+            expected = "" if solved else single.guess(guess).feedback
+            assert result.feedback[board] == expected
+    assert multi.solved.all()
+    assert np.array_equal(multi.solved_at, [1, 5, 3, 4])
+
+
+def test_guess_outside_latin1_is_rejected():
+    game = MultiLeWordGame(["mazda", "honda"], "")
+    result = game.guess("mazdа")  # Cyrillic a
+    assert result.feedback == INVALID_LENGTH
+    assert len(game.attempts) == 1 and not game.solved.any()
+
+
+def test_solved_boards_are_frozen():
+    game = MultiLeWordGame(["mazda", "honda"], "")
+    game.guess("mazda")
+    game.guess("toolong")
+    game.guess("lexus")
+    assert [attempt.guess for attempt in game.board_state(0).attempts] == ["mazda"]
+    assert [attempt.guess for attempt in game.board_state(1).attempts] == ["mazda", "toolong", "lexus"]
+    assert game.attempts[1].board_result(0) is None
+
+
+def test_agent_candidates_follow_the_game():
+    from agents.word_agent import word_agent_decide_multi_guess
+
+    words = ["mazda", "honda", "lexus", "acura", "dacia", "opels", "skoda", "volvo", "buick", "tesla"]
+    game = MultiLeWordGame(["honda", "volvo", "tesla", "skoda"], "")
+    while not game.is_game_over():
+        next_guess = word_agent_decide_multi_guess(game, words)
+        # Narrowed incrementally or from scratch, the candidates give the same guess
+        fresh = MultiLeWordGame(game.target_words, "")
+        for attempt in game.attempts:
+            fresh.guess(attempt.guess)
+        assert word_agent_decide_multi_guess(fresh, words) == next_guess
+        game.guess(next_guess)
+    assert game.solved.all()
@@ -0,0 +1,36 @@
+# tests/test_opening_book.py
+import random
+
+import agents.word_agent as word_agent
+from game.leword_game import LeWordGame
+from game.opening_book import OpeningBook, build_opening_book
+
+
+def play(target, words, book, max_attempts=8):
+    game = LeWordGame(target, "", max_attempts)
+    while not game.is_game_over():
+        game.guess(word_agent.word_agent_decide_guess(None, game.live_state, words=words, book=book))
+    return [attempt.guess for attempt in game.attempts]
+
+
+def test_book_matches_online_search(tmp_path, monkeypatch):
+    rng = random.Random(20)
+    words = sorted({"".join(rng.choice("abcdeilnorst") for _ in range(5)) for _ in range(300)})
+    book = OpeningBook(build_opening_book(words, str(tmp_path / "book.bin"), depth=3, workers=2))
+    assert book.words == words and book.depth == 3
+
+    # Online play must not pick up a book from the user's cache
+    monkeypatch.setattr(word_agent, "_opening_book", lambda words, word_length: None)
+    for target in rng.sample(words, 40):
+        assert play(target, words, book) == play(target, words, None)
+
+
+def test_lookup_off_book(tmp_path):
+    words = ["crane", "slate", "trace", "crate", "react", "cater", "later", "alert"]
+    book = OpeningBook(build_opening_book(words, str(tmp_path / "book.bin"), depth=2, workers=1))
+    opening = book.lookup([])
+    assert opening in words
+    other = next(word for word in words if word != opening)
+    assert book.lookup([(other, "?????")]) is None
+    feedback = LeWordGame("alert", "").guess(opening).feedback
+    assert book.lookup([(opening, feedback)]) in words
@@ -0,0 +1,107 @@
+# tests/test_server.py
+import asyncio
+
+import pytest
+
+from game.leword_game import INVALID_LENGTH, NOT_IN_WORD_LIST, GuessResult
+from server.app import GameServer
+from server.loadgen import HttpClient, WebSocketClient
+from server.session_store import SessionNotFound, SessionStore
+from tools.game_tools import guess
+
+WORDS = ["mazda", "honda", "lexus"]
+
+
+def test_store_round_trip():
+    store = SessionStore(capacity=2)
+    session_id = store.create("Mazda", "car", 6)
+    game = store.game(session_id)
+    guess("honda", game=game)
+    guess("maz", game=game)
+    game.attempts.append(GuessResult("mazdx", NOT_IN_WORD_LIST))
+    store.save(session_id, game)
+
+    restored = store.game(session_id)
+    assert restored.target_word == "mazda" and restored.hint == "car"
+    assert restored.state() == game.state()
+    assert [attempt.feedback for attempt in restored.attempts[1:]] == [INVALID_LENGTH, NOT_IN_WORD_LIST]
+    guess("mazda", game=restored)
+    store.save(session_id, restored)
+    assert store.is_over(session_id)
+
+
+def test_store_grows_and_rejects_stale_ids():
+    store = SessionStore(capacity=1)
+    first = store.create("mazda")
+    second = store.create("honda")
+    assert store.capacity == 2 and len(store) == 2
+    store.delete(first)
+    with pytest.raises(SessionNotFound):
+        store.game(first)
+    third = store.create("lexus")
+    assert third.split("-")[0] == first.split("-")[0] and third != first
+    assert store.game(second).target_word == "honda"
+
+
+@pytest.mark.parametrize("target", ["straße", "ß", "two words", "x" * 33, 5])
+def test_store_and_server_reject_bad_targets(target):
+    async def create():
+        async with GameServer(WORDS, port=0) as server:
+            client = HttpClient(server.host, server.port)
+            await client.connect()
+            try:
+                return await client.request("POST", "/sessions", {"target": target})
+            finally:
+                await client.close()
+
+    status, reply = asyncio.run(create())
+    assert status == 400 and "error" in reply
+
+
+def test_http_game():
+    async def play():
+        async with GameServer(WORDS, port=0) as server:
+            client = HttpClient(server.host, server.port)
+            await client.connect()
+            try:
+                status, created = await client.request("POST", "/sessions", {"target": "honda", "max_attempts": 2})
+                assert status == 201 and created["word_length"] == 5
+                base = f"/sessions/{created['session_id']}"
+                status, result = await client.request("POST", f"{base}/guess", {"guess": "mazda"})
+                assert status == 200 and result["feedback"] == "???DA" and result["attempts_left"] == 1
+                status, result = await client.request("POST", f"{base}/guess", {"guess": "honda"})
+                assert status == 200 and result["correct"]
+                status, _ = await client.request("POST", f"{base}/guess", {"guess": "lexus"})
+                assert status == 409
+                status, board = await client.request("GET", f"{base}/board")
+                assert status == 200 and board
+                status, _ = await client.request("DELETE", base)
+                assert status == 200
+                status, _ = await client.request("GET", f"{base}/hint")
+                assert status == 404
+            finally:
+                await client.close()
+
+    asyncio.run(play())
+
+
+def test_websocket_game():
+    async def play():
+        async with GameServer(WORDS, port=0) as server:
+            client = WebSocketClient(server.host, server.port)
+            await client.connect()
+            try:
+                _, created = await client.op({"op": "new", "target": "lexus", "hint": "car"})
+                session_id = created["session_id"]
+                _, result = await client.op({"op": "guess", "session_id": session_id, "guess": "lex"})
+                assert result["ok"] and result["feedback"] == INVALID_LENGTH
+                _, result = await client.op({"op": "hint", "session_id": session_id})
+                assert "car" in result["hint"]
+                _, result = await client.op({"op": "guess", "session_id": session_id, "guess": "lexus"})
+                assert result["correct"]
+                status, result = await client.op({"op": "nope"})
+                assert status == 400 and not result["ok"]
+            finally:
+                await client.close()
+
+    asyncio.run(play())
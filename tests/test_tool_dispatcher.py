@@ -0,0 +1,72 @@
+# tests/test_tool_dispatcher.py
+import threading
+import time
+
+from agents.tool_dispatcher import ToolCall, ToolDispatcher, shared_pool, tool_messages
+
+
+def test_read_only_calls_run_concurrently():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def read(game):
+        barrier.wait()  # only returns once all three calls are running at once
+        return {"thread": threading.get_ident()}
+
+    dispatcher = ToolDispatcher({"hint": read}, read_only={"hint"}, max_workers=3)
+    with dispatcher:
+        results = dispatcher.dispatch([ToolCall(f"c{i}", "hint", "{}") for i in range(3)], game=None)
+    assert len({result["thread"] for result in results}) == 3
+
+
+def test_mutating_calls_are_barriers():
+    events = []
+
+    def read(game):
+        time.sleep(0.01)
+        events.append("read")
+        return {}
+
+    def write(game, word):
+        events.append(f"write {word}")
+        return {"guess": word}
+
+    dispatcher = ToolDispatcher({"hint": read, "guess": write}, read_only={"hint"}, max_workers=4)
+    calls = [
+        ToolCall("a", "hint", "{}"), ToolCall("b", "hint", "{}"),
+        ToolCall("c", "guess", '{"word": "mazda"}'),
+        ToolCall("d", "hint", "{}"),
+        ToolCall("e", "guess", '{"word": "honda"}'),
+    ]
+    with dispatcher:
+        results = dispatcher.dispatch(calls, game=None)
+    assert events == ["read", "read", "write mazda", "read", "write honda"]
+    assert results[2] == {"guess": "mazda"} and results[4] == {"guess": "honda"}
+
+
+def test_errors_become_results():
+    def broken(game):
+        raise RuntimeError("board unavailable")
+
+    dispatcher = ToolDispatcher({"hint": broken, "guess": lambda game, guess: {"guess": guess}})
+    calls = [
+        ToolCall("a", "hint", "{}"),
+        ToolCall("b", "guess", "not json"),
+        ToolCall("c", "nope", "{}"),
+        ToolCall("d", "guess", '{"guess": "mazda"}'),
+    ]
+    results = dispatcher.dispatch(calls, game=None)
+    assert results[0] == {"error": "RuntimeError: board unavailable"}
+    assert results[1]["error"].startswith("JSONDecodeError")
+    assert results[2] == {"error": "Unknown tool: nope"}
+    assert results[3] == {"guess": "mazda"}
+
+    messages = tool_messages(calls, results)
+    assert [m["role"] for m in messages] == ["assistant", "tool", "tool", "tool", "tool"]
+    assert [m["tool_call_id"] for m in messages[1:]] == ["a", "b", "c", "d"]
+
+
+def test_dispatchers_share_the_pool():
+    first, second = ToolDispatcher({}), ToolDispatcher({})
+    assert first.pool is second.pool is shared_pool()
+    first.close()
+    assert not shared_pool()._shutdown
@@ -0,0 +1,57 @@
+# tests/test_tracing.py
+import threading
+
+import tools.tracing
+from tools.tracing import Tracer
+
+
+def quantiles(text, stage):
+    values = {}
+    for line in text.splitlines():
+        if line.startswith(f'leword_stage_seconds{{stage="{stage}",quantile='):
+            quantile = line.split('quantile="')[1].split('"')[0]
+            values[quantile] = float(line.rsplit(" ", 1)[1])
+    return values
+
+
+def test_quantiles_follow_the_latest_window(monkeypatch):
+    monkeypatch.setattr(tools.tracing, "MAX_SAMPLES", 100)
+    tracer = Tracer(enabled=True)
+    for seconds in [0.001] * 100 + [0.5] * 100:
+        tracer._record_span("decide", seconds)
+
+    text = tracer.prometheus_text()
+    assert quantiles(text, "decide") == {"0.5": 0.5, "0.9": 0.5, "0.99": 0.5}
+    # Count and sum still cover every span
+    assert 'leword_stage_seconds_count{stage="decide"} 200' in text
+    assert len(tracer.durations["decide"]) == 100
+
+
+def test_turn_records_and_threads():
+    tracer = Tracer(enabled=True)
+
+    def play(turns):
+        for turn in range(turns):
+            tracer.begin_turn(turn=turn)
+            with tracer.span("guess"):
+                tracer.count("png_encodes")
+            record = tracer.end_turn()
+            assert record["turn"] == turn and record["counters"] == {"png_encodes": 1}
+            assert set(record["spans_ms"]) == {"guess"}
+
+    threads = [threading.Thread(target=play, args=(50,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tracer.counters["png_encodes"] == 400
+    assert tracer.totals["guess"][0] == 400
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+    with tracer.span("guess"):
+        tracer.count("png_encodes")
+    tracer.begin_turn(turn=1)
+    assert tracer.end_turn() is None
+    assert not tracer.durations and not tracer.counters
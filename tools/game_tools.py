@@ -1,7 +1,5 @@
 from game.leword_game import LeWordGame, GuessResult
-from vision.render_board import render_leword_board
-from io import BytesIO
-import base64
+from vision.render_board import render_leword_board, board_backend, board_rows, encode_png_base64
 
 # def guess(guess: str, game: LeWordGame):
 #     result = game.guess(guess)
@@ -10,12 +8,16 @@ import base64
 def guess(guess: str, game: LeWordGame):
     result = game.guess(guess)
 
-    return {        
+    response = {
         "guess": result.guess,
         "feedback": result.feedback,
         "score": result.score,
         "correct": result.correct
     }
+    # Multi-target games (game/multi_game.py) report per-board feedback and completion
+    if hasattr(result, "solved"):
+        response["boards_solved"] = result.solved.tolist()
+    return response
 
 def hint(game: LeWordGame) -> str:
     hint = game.get_hint()
@@ -24,19 +26,12 @@ def hint(game: LeWordGame) -> str:
     else:
         return "No hint available."
     
-def show_board_image(game):
+def show_board_image(game, backend=None):
     """
     Render the current game board and return it as a base64-encoded PNG image.
     """
-    feedbacks = [list(result.feedback) for result in game.attempts]
     word_length = len(game.target_word)
-
-    img = render_leword_board(feedbacks, word_length)
-
-    buffered = BytesIO()
-    img.save(buffered, format="PNG")
-    img_bytes = buffered.getvalue()
-    img_base64 = base64.b64encode(img_bytes).decode("utf-8")
+    img_base64 = _board_base64(game, backend)
 
     return {
         "image_base64": img_base64,
@@ -79,16 +74,19 @@ def available_tools():
         }        
     ]
 
-def render_board(game):
-    # Render PIL Image of current game state
-    img = render_leword_board([f for _, f in game.attempts])
+def _board_base64(game, backend=None):
+    # The game's canvas only redraws the newest row and memoizes the encoding;
+    # multi-target games are always drawn on their canvas grid
+    if board_backend(backend) == "pil" or hasattr(game, "n_boards"):
+        return game.board.png_base64()
 
-    # Convert to base64 string so it can be passed easily as JSON
-    buffered = BytesIO()
-    img.save(buffered, format="PNG")
-    img_str = base64.b64encode(buffered.getvalue()).decode()
+    feedbacks = board_rows(game.attempts, game.word_length)
+    pixels = render_leword_board(feedbacks, len(game.target_word), backend=backend, as_array=True)
+    return encode_png_base64(pixels)
 
-    return {"image_base64": img_str}
+def render_board(game, backend=None):
+    # Render current game state as a base64 string so it can be passed easily as JSON
+    return {"image_base64": _board_base64(game, backend)}
 
 def reveal_letter(index: int, game: LeWordGame) -> dict:
     if index < 0 or index >= len(game.answer):
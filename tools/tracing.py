@@ -0,0 +1,141 @@
+# tools/tracing.py
+import atexit
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+
+import numpy as np
+
+# Shared no-op span handed out while tracing is off
+_NULL_SPAN = nullcontext()
+
+# Most recent span durations kept per stage for the summary quantiles
+MAX_SAMPLES = 10000
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "started")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._record_span(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class Tracer:
+    """
+    Per-turn timing spans and counters for the game loop. While disabled,
+    span() returns a shared no-op context manager and count() returns
+    immediately, so instrumented code pays one attribute check.
+    """
+
+    def __init__(self, enabled=False, jsonl_path=None):
+        self.enabled = enabled
+        self.jsonl_path = jsonl_path
+        self._jsonl = None
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.counters = defaultdict(int)
+        self.durations = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+        self.totals = defaultdict(lambda: [0, 0.0])  # name -> [count, seconds]
+
+    def span(self, name):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def count(self, name, n=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] += n
+        turn = getattr(self.local, "turn", None)
+        if turn is not None:
+            turn["counters"][name] = turn["counters"].get(name, 0) + n
+
+    def _record_span(self, name, seconds):
+        with self.lock:
+            self.durations[name].append(seconds)
+            total = self.totals[name]
+            total[0] += 1
+            total[1] += seconds
+        turn = getattr(self.local, "turn", None)
+        if turn is not None:
+            turn["spans_ms"][name] = turn["spans_ms"].get(name, 0.0) + seconds * 1000.0
+
+    def begin_turn(self, **fields):
+        """Starts collecting a per-turn record (game id, turn number, ...)."""
+        if not self.enabled:
+            return
+        self.local.turn = {**fields, "started": time.time(), "spans_ms": {}, "counters": {}}
+
+    def end_turn(self, **fields):
+        """Finishes the current turn record and appends it to the JSON lines file."""
+        turn = getattr(self.local, "turn", None)
+        if not self.enabled or turn is None:
+            return None
+        self.local.turn = None
+        turn.update(fields)
+        if self.jsonl_path:
+            line = json.dumps(turn, default=str) + "\n"
+            with self.lock:
+                if self._jsonl is None:
+                    self._jsonl = open(self.jsonl_path, "a", encoding="utf-8")
+                    atexit.register(self.close)
+                self._jsonl.write(line)
+        return turn
+
+    def close(self):
+        """Flushes and closes the JSON lines file."""
+        with self.lock:
+            if self._jsonl is not None:
+                self._jsonl.close()
+                self._jsonl = None
+
+    def prometheus_text(self, prefix="leword"):
+        """Prometheus text-format summary of span durations and counters."""
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent per turn stage.",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        with self.lock:
+            for name, samples in sorted(self.durations.items()):
+                samples = np.fromiter(samples, dtype=float)
+                for q in (0.5, 0.9, 0.99):
+                    value = float(np.quantile(samples, q)) if samples.size else 0.0
+                    lines.append(f'{prefix}_stage_seconds{{stage="{name}",quantile="{q}"}} {value:.9f}')
+                count, seconds = self.totals[name]
+                lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {seconds:.9f}')
+                lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {count}')
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE {prefix}_{name}_total counter")
+                lines.append(f"{prefix}_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, prefix="leword"):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text(prefix))
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.durations.clear()
+            self.totals.clear()
+
+
+# Process-wide tracer, off unless LEWORD_TRACE is set (to a JSON lines path or "1")
+_trace_setting = os.getenv("LEWORD_TRACE", "")
+tracer = Tracer(
+    enabled=bool(_trace_setting),
+    jsonl_path=_trace_setting if _trace_setting not in ("", "1") else None,
+)
@@ -0,0 +1,276 @@
+"""
+Headless tournament runner: plays many LeWord games with the word agent across
+a process pool and prints aggregate statistics as JSON.
+
+    python tournament.py --words words.txt --games 5000 --agent word --workers 8
+
+With --threads, each worker plays that many games at once; vision games then
+share one batching CLIP encoder per worker (agents.vision_agent.board_batcher).
+"""
+import argparse
+import json
+import multiprocessing.util
+import os
+import random
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from game.leword_game import LeWordGame
+from game.candidate_index import CandidateIndex
+from game.event_log import EventLogWriter
+from game.lexicon import Lexicon
+import agents.word_agent
+from agents.word_agent import all_words, word_agent_decide_guess
+
+AGENTS = ("word", "vision", "symbolic")
+# "decide" times the word agent; "decide_cached" a guess replayed from the decision memo
+STAGES = ("render", "encode", "state", "decide", "decide_cached", "guess")
+# Guess histories remembered per worker, least recently used dropped first
+DECISION_CACHE_SIZE = 4096
+
+# Per-worker state, filled in by _init_worker
+_worker = {}
+
+
+def load_words(path):
+    with open(path, encoding="utf-8") as f:
+        return sorted({line.strip().lower() for line in f if line.strip().isalpha()})
+
+
+def _init_worker(words, agent, max_attempts, event_log=None, lexicon=None, threads=1):
+    """Loads the lexicon indexes (and the vision model) once per worker process."""
+    _worker["words"] = words
+    # Games reject guesses outside the lexicon when the words come from it
+    _worker["lexicon"] = Lexicon(lexicon) if lexicon else None
+    _worker["agent"] = agent
+    _worker["max_attempts"] = max_attempts
+    _worker["indexes"] = {}
+    _worker["lock"] = threading.Lock()
+    _worker["game_threads"] = ThreadPoolExecutor(threads, thread_name_prefix="games") if threads > 1 else None
+    _worker["event_log"] = None
+    if event_log:
+        writer = EventLogWriter(event_log)
+        # Pool workers skip atexit, so flush through multiprocessing's finalizers
+        multiprocessing.util.Finalize(writer, writer.close, exitpriority=10)
+        _worker["event_log"] = writer
+    # The solver is deterministic, so a guess history always leads to the same
+    # next guess; the opening and early replies repeat across games.
+    _worker["decisions"] = OrderedDict()
+    if agent == "vision":
+        from vision.model_registry import warm_up
+        from vision.embedding_cache import BoardEmbeddingCache
+
+        warm_up("hf-clip")
+        _worker["embedding_cache"] = BoardEmbeddingCache(max_entries=4096)
+
+
+def _candidates(word_length):
+    indexes = _worker["indexes"]
+    with _worker["lock"]:
+        if word_length not in indexes:
+            indexes[word_length] = CandidateIndex([w for w in _worker["words"] if len(w) == word_length])
+        index = indexes[word_length]
+    return index.candidates()
+
+
+def _encode_board(game, turn):
+    """Board embedding; `turn` gets render and encode times only when they ran (a cache miss)."""
+    from agents.vision_agent import board_batcher, vision_agent_process_board
+
+    def render_and_encode():
+        started = time.perf_counter()
+        board_img = game.board.array(min_rows=1)
+        rendered = time.perf_counter()
+        if _worker["game_threads"] is not None:
+            # Concurrent games in this worker share CLIP batches; encode includes the queue wait
+            embedding = board_batcher().encode(board_img)
+        else:
+            embedding = vision_agent_process_board(board_img)
+        turn["render"] = rendered - started
+        turn["encode"] = time.perf_counter() - rendered
+        return embedding
+
+    return _worker["embedding_cache"].get_or_compute(
+        [attempt.feedback for attempt in game.attempts], game.word_length, render_and_encode
+    )
+
+
+def play_game(target):
+    """Plays one game against `target` and returns its result and stage timings."""
+    lexicon = _worker["lexicon"]
+    if lexicon is not None and not lexicon.count(len(target)):
+        lexicon = None
+    game = LeWordGame(target, "", _worker["max_attempts"], lexicon=lexicon)
+    candidates = _candidates(game.word_length)
+    timings = defaultdict(list)
+    event_log = _worker["event_log"]
+    game_id = event_log.start_game(game) if event_log is not None else None
+
+    for _ in range(game.max_attempts):
+        # Seconds per stage that ran this turn
+        turn = {}
+        vision_embedding = None
+        if _worker["agent"] == "vision":
+            vision_embedding = _encode_board(game, turn)
+
+        started = time.perf_counter()
+        game_state = game.live_state
+        state_built = time.perf_counter()
+        if _worker["agent"] == "symbolic":
+            from agents.vision_agent import symbolic_agent_process_board
+
+            vision_embedding = symbolic_agent_process_board(game_state)
+            turn["encode"] = time.perf_counter() - state_built
+            state_built = time.perf_counter()
+        decisions = _worker["decisions"]
+        key = (game.word_length, tuple((a.guess, a.feedback) for a in game.attempts))
+        with _worker["lock"]:
+            next_guess = decisions.get(key)
+            if next_guess is not None:
+                decisions.move_to_end(key)
+        if next_guess is None:
+            next_guess = word_agent_decide_guess(
+                vision_embedding, game_state, words=_worker["words"], candidates=candidates
+            )
+            with _worker["lock"]:
+                decisions[key] = next_guess
+                if len(decisions) > DECISION_CACHE_SIZE:
+                    decisions.popitem(last=False)
+            decide_stage = "decide"
+        else:
+            candidates.sync(key[1])
+            decide_stage = "decide_cached"
+        decided = time.perf_counter()
+        result = game.guess(next_guess)
+        guessed = time.perf_counter()
+
+        turn["state"] = state_built - started
+        turn[decide_stage] = decided - state_built
+        turn["guess"] = guessed - decided
+        for stage, seconds in turn.items():
+            timings[stage].append(seconds)
+        if event_log is not None:
+            # Stages missing from the turn are logged as NaN
+            event_log.log_turn(game_id, game, result, {stage: seconds * 1000.0 for stage, seconds in turn.items()})
+        if result.correct:
+            break
+
+    return {
+        "target": target,
+        "won": bool(game.attempts and game.attempts[-1].correct),
+        "guesses": len(game.attempts),
+        "timings": dict(timings),
+    }
+
+
+def play_games(targets):
+    """Plays a chunk of games on the worker's game threads."""
+    return list(_worker["game_threads"].map(play_game, targets))
+
+
+def _percentiles(samples):
+    if not samples:
+        return None
+    ms = np.array(samples) * 1000.0
+    return {
+        "count": int(ms.size),
+        "mean_ms": float(ms.mean()),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p90_ms": float(np.percentile(ms, 90)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "max_ms": float(ms.max()),
+    }
+
+
+def summarize(results, elapsed):
+    """Aggregate win rate, guess distribution and per-stage latency percentiles."""
+    wins = [r for r in results if r["won"]]
+    stage_samples = defaultdict(list)
+    for r in results:
+        for stage, samples in r["timings"].items():
+            stage_samples[stage].extend(samples)
+
+    return {
+        "games": len(results),
+        "wins": len(wins),
+        "win_rate": len(wins) / len(results) if results else 0.0,
+        "mean_guesses_when_won": float(np.mean([r["guesses"] for r in wins])) if wins else None,
+        "guess_distribution": {
+            str(n): count for n, count in sorted(Counter(r["guesses"] for r in wins).items())
+        },
+        "failed_targets": [r["target"] for r in results if not r["won"]][:100],
+        "decisions": {
+            "searched": len(stage_samples["decide"]),
+            "cached": len(stage_samples["decide_cached"]),
+        },
+        "latency": {stage: _percentiles(stage_samples[stage]) for stage in STAGES if stage_samples[stage]},
+        "elapsed_s": elapsed,
+        "games_per_s": len(results) / elapsed if elapsed else 0.0,
+    }
+
+
+def run_tournament(words, games=None, agent="word", workers=None, max_attempts=6, seed=0, event_log=None,
+                   lexicon=None, threads=1):
+    """
+    Plays `games` games (every word once by default) and returns the summary.
+    With `event_log`, every turn is also appended to that game event log.
+    With `lexicon`, the path of a game.lexicon file, guesses outside it are
+    rejected as "Not in the word list.".
+    With `threads` > 1, each worker process plays that many games at once.
+    """
+    if agent not in AGENTS:
+        raise ValueError(f"Unknown agent: {agent}")
+    targets = list(words)
+    if games is not None:
+        rng = random.Random(seed)
+        targets = [rng.choice(targets) for _ in range(games)]
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(list(words), agent, max_attempts, event_log, lexicon, threads)) as pool:
+        chunksize = max(1, len(targets) // (workers * 16))
+        if threads > 1:
+            # Chunks big enough to keep every game thread of a worker busy
+            chunksize = max(chunksize, threads)
+            chunks = [targets[i:i + chunksize] for i in range(0, len(targets), chunksize)]
+            results = [result for chunk in pool.map(play_games, chunks) for result in chunk]
+        else:
+            results = list(pool.map(play_game, targets, chunksize=chunksize))
+    return summarize(results, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play many LeWord games headlessly and report stats.")
+    parser.add_argument("--words", help="word list file, one word per line (default: the word agent's list)")
+    parser.add_argument("--games", type=int, help="number of games, with random targets (default: every word once)")
+    parser.add_argument("--agent", choices=AGENTS, default="word", help="word agent alone, with CLIP board embeddings, or with symbolic board features")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--threads", type=int, default=1, help="games played at once per worker; vision games share CLIP batches")
+    parser.add_argument("--max-attempts", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON summary here instead of stdout")
+    parser.add_argument("--event-log", help="append every turn to this game event log")
+    args = parser.parse_args()
+
+    if args.words:
+        words, lexicon = load_words(args.words), None
+    else:
+        words = all_words()
+        lexicon = agents.word_agent.LEXICON.path if agents.word_agent.LEXICON is not None else None
+    summary = run_tournament(words, args.games, args.agent, args.workers, args.max_attempts, args.seed,
+                             args.event_log, lexicon, args.threads)
+    text = json.dumps(summary, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# vision/batching.py
+import asyncio
+import queue
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+
+import numpy as np
+
+# Queueing latencies kept for percentile reporting
+LATENCY_SAMPLES = 10000
+
+
+class BatchingEncoder:
+    """
+    Collects single-image encode requests from many callers and runs them
+    through `encode_batch` together. A batch is flushed after `max_wait_ms`
+    from its first request or once it holds `max_batch_size` images.
+
+    `encode_batch` takes a list of images and returns an array with one row
+    per image.
+    """
+
+    def __init__(self, encode_batch, max_batch_size=32, max_wait_ms=5.0):
+        self.encode_batch = encode_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.requests = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+        self.batch_sizes = Counter()
+        self.queue_latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def _start_locked(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="batching-encoder", daemon=True)
+            self.thread.start()
+
+    def start(self):
+        with self.lock:
+            self._start_locked()
+        return self
+
+    def stop(self):
+        """Finishes queued requests and stops the worker thread; a no-op if it never started."""
+        with self.lock:
+            thread, self.thread = self.thread, None
+            if thread is None:
+                return
+            # Queued under the lock so no request can land behind the marker
+            # without a worker to pick it up
+            self.requests.put(None)
+        thread.join()
+
+    def submit(self, image) -> Future:
+        """Queues one image and returns a future resolving to its embedding."""
+        future = Future()
+        with self.lock:
+            self._start_locked()
+            self.requests.put((image, future, time.perf_counter()))
+        return future
+
+    def encode(self, image, timeout=None) -> np.ndarray:
+        """Blocking encode of one image, for use from threads."""
+        return self.submit(image).result(timeout)
+
+    async def aencode(self, image) -> np.ndarray:
+        """Awaitable encode of one image, for use from asyncio."""
+        return await asyncio.wrap_future(self.submit(image))
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = first[2] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining > 0:
+                    request = self.requests.get(timeout=remaining)
+                else:
+                    # Window is over, but still take whatever is already queued
+                    request = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # Re-queue the stop marker so the loop exits after this batch
+                self.requests.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self.requests.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+            started = time.perf_counter()
+            images = [image for image, _, _ in batch]
+            try:
+                embeddings = self.encode_batch(images)
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            with self.lock:
+                self.batch_sizes[len(batch)] += 1
+                self.queue_latencies.extend(started - queued for _, _, queued in batch)
+            for (_, future, _), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
+
+    def stats(self):
+        with self.lock:
+            batches = sum(self.batch_sizes.values())
+            images = sum(size * count for size, count in self.batch_sizes.items())
+            latencies = np.array(self.queue_latencies) * 1000.0
+        return {
+            "batches": batches,
+            "images": images,
+            "mean_batch_size": images / batches if batches else 0.0,
+            "batch_sizes": dict(sorted(self.batch_sizes.items())),
+            "queue_ms_p50": float(np.percentile(latencies, 50)) if latencies.size else 0.0,
+            "queue_ms_p95": float(np.percentile(latencies, 95)) if latencies.size else 0.0,
+            "queue_ms_max": float(latencies.max()) if latencies.size else 0.0,
+        }
@@ -0,0 +1,144 @@
+# vision/board_canvas.py
+import base64
+import threading
+
+import numpy as np
+from PIL import Image
+
+from vision.fast_render import CELL_SIZE, PADDING, blit_row, board_size, new_board_array
+from vision.render_board import encode_png
+
+
+class BoardCanvas:
+    """
+    Pixel buffer for one game's board. Each guess draws only its own row, and the
+    PIL image, PNG bytes and base64 string are memoized until the next row.
+    In-process consumers such as the vision agent should take array(); PNG is
+    only for images that leave the process.
+    """
+
+    def __init__(self, word_length, rows=6, cell_size=CELL_SIZE, padding=PADDING):
+        self.word_length = word_length
+        self.cell_size = cell_size
+        self.padding = padding
+        self.rows = 0
+        self.pixels = self._blank(max(rows, 1))
+        self._memo = {}
+        # Guards pixels and the memo; tools may read the board from several threads
+        self.lock = threading.RLock()
+
+    def _memoized(self, key, compute):
+        # Re-entrant: png_base64 computes png_bytes under the same lock
+        with self.lock:
+            if key not in self._memo:
+                self._memo[key] = compute()
+            return self._memo[key]
+
+    def _blank(self, capacity):
+        return new_board_array(capacity, self.word_length, self.cell_size, self.padding)
+
+    def capacity(self):
+        return (self.pixels.shape[0] - 2 * self.padding) // self.cell_size
+
+    def append_row(self, feedback):
+        """Draws the next feedback row in place; None draws a row of blank tiles."""
+        with self.lock:
+            if self.rows == self.capacity():
+                grown = self._blank(2 * self.capacity())
+                grown[:self.pixels.shape[0]] = self.pixels
+                self.pixels = grown
+            row = ' ' * self.word_length if feedback is None else feedback
+            blit_row(self.pixels, self.rows, row, self.cell_size, self.padding)
+            self.rows += 1
+            self._memo.clear()
+
+    def append_result(self, result):
+        """
+        Draws a GuessResult. A rejected guess carries a message rather than
+        feedback, so it uses up a row of blank tiles instead of drawing the
+        message's letters as if they were scored.
+        """
+        self.append_row(result.feedback if result.pattern >= 0 else None)
+
+    def array(self, min_rows=0):
+        """
+        Read-only view of the drawn rows. With fewer than `min_rows` rows drawn,
+        returns a copy padded with empty tiles instead.
+        """
+        with self.lock:
+            rows, pixels = self.rows, self.pixels
+        height, _ = board_size(max(rows, min_rows), self.word_length, self.cell_size, self.padding)
+        if rows >= min_rows:
+            view = pixels[:height]
+            view.flags.writeable = False
+            return view
+
+        padded = self._blank(min_rows)
+        drawn_height, _ = board_size(rows, self.word_length, self.cell_size, self.padding)
+        padded[:drawn_height] = pixels[:drawn_height]
+        for row_idx in range(rows, min_rows):
+            blit_row(padded, row_idx, ' ' * self.word_length, self.cell_size, self.padding)
+        return padded
+
+    def image(self, min_rows=0):
+        return self._memoized(("image", min_rows),
+                              lambda: Image.fromarray(np.ascontiguousarray(self.array(min_rows)), "RGB"))
+
+    def png_bytes(self, min_rows=0):
+        return self._memoized(("png", min_rows), lambda: encode_png(self.array(min_rows)))
+
+    def png_base64(self, min_rows=0):
+        return self._memoized(("base64", min_rows),
+                              lambda: base64.b64encode(self.png_bytes(min_rows)).decode("utf-8"))
+
+
+class BoardGrid:
+    """
+    Boards of a multi-target game laid out `columns` per row, one BoardCanvas
+    each. A board stops getting rows once it is solved. Offers the same
+    array/image/png_bytes/png_base64 methods as BoardCanvas.
+    """
+
+    def __init__(self, n_boards, word_length, rows=6, columns=4, cell_size=CELL_SIZE, padding=PADDING):
+        self.columns = min(columns, n_boards)
+        self.canvases = [BoardCanvas(word_length, rows, cell_size, padding) for _ in range(n_boards)]
+        self._memo = {}
+        self.lock = threading.RLock()
+
+    def _memoized(self, key, compute):
+        # Re-entrant: png_base64 computes png_bytes under the same lock
+        with self.lock:
+            if key not in self._memo:
+                self._memo[key] = compute()
+            return self._memo[key]
+
+    def append_guess(self, result):
+        """Adds a MultiGuessResult's feedback to every board that was still open."""
+        feedback = result.feedback
+        with self.lock:
+            for board, canvas in enumerate(self.canvases):
+                if isinstance(feedback, str):
+                    if not result.solved[board]:
+                        canvas.append_row(None)
+                elif feedback[board]:
+                    canvas.append_row(feedback[board])
+            self._memo.clear()
+
+    def array(self, min_rows=0):
+        with self.lock:
+            rows = max([min_rows] + [canvas.rows for canvas in self.canvases])
+            tiles = [canvas.array(rows) for canvas in self.canvases]
+        blank = np.zeros_like(tiles[0])
+        tiles += [blank] * (-len(tiles) % self.columns)
+        lines = [np.hstack(tiles[i:i + self.columns]) for i in range(0, len(tiles), self.columns)]
+        return np.vstack(lines)
+
+    def image(self, min_rows=0):
+        return self._memoized(("image", min_rows), lambda: Image.fromarray(self.array(min_rows), "RGB"))
+
+    def png_bytes(self, min_rows=0):
+        return self._memoized(("png", min_rows), lambda: encode_png(self.array(min_rows)))
+
+    def png_base64(self, min_rows=0):
+        return self._memoized(("base64", min_rows),
+                              lambda: base64.b64encode(self.png_bytes(min_rows)).decode("utf-8"))
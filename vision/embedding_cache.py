@@ -0,0 +1,118 @@
+# vision/embedding_cache.py
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from vision.render_board import renderer_id
+from tools.tracing import tracer
+
+
+def _current_encoder():
+    from agents.vision_agent import VISION_MODEL
+
+    return VISION_MODEL
+
+
+def board_key(feedback_rows, word_length, renderer=None, encoder=None):
+    """
+    Canonical key for a board: its embedding depends only on the feedback
+    rows, the word length, the renderer that drew them and the model that
+    encoded the image (agents.vision_agent.VISION_MODEL by default).
+    """
+    rows = ["".join(row) for row in feedback_rows]
+    content = "\x1f".join([encoder or _current_encoder(), renderer or renderer_id(), str(word_length)] + rows)
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class BoardEmbeddingCache:
+    """
+    LRU cache of board embeddings with an optional on-disk tier. Memory use is
+    bounded by `max_entries`; entries evicted from memory stay on disk.
+    """
+
+    def __init__(self, max_entries=1024, cache_dir=None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def _remember(self, key, embedding):
+        self.entries[key] = embedding
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def get(self, key):
+        """Stored embedding for `key`, or None."""
+        with self.lock:
+            embedding = self.entries.get(key)
+            if embedding is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                tracer.count("embedding_cache_hits")
+                return embedding
+
+        if self.cache_dir and os.path.exists(self._disk_path(key)):
+            embedding = np.load(self._disk_path(key))
+            with self.lock:
+                self._remember(key, embedding)
+                self.hits += 1
+                self.disk_hits += 1
+            tracer.count("embedding_cache_hits")
+            return embedding
+
+        with self.lock:
+            self.misses += 1
+        tracer.count("embedding_cache_misses")
+        return None
+
+    def put(self, key, embedding):
+        embedding = np.asarray(embedding)
+        embedding.setflags(write=False)
+        with self.lock:
+            self._remember(key, embedding)
+        if self.cache_dir:
+            # Write then rename so concurrent readers never load a partial file
+            tmp_path = f"{self._disk_path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, embedding)
+            os.replace(tmp_path, self._disk_path(key))
+
+    def get_or_compute(self, feedback_rows, word_length, compute, renderer=None, encoder=None):
+        """
+        Returns the embedding for this board, calling `compute()` (render + model)
+        only on a miss.
+        """
+        key = board_key(feedback_rows, word_length, renderer, encoder)
+        embedding = self.get(key)
+        if embedding is None:
+            embedding = compute()
+            self.put(key, embedding)
+        return embedding
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self.entries),
+                "max_entries": self.max_entries,
+            }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
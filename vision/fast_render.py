@@ -0,0 +1,106 @@
+# vision/fast_render.py
+import threading
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# Same palette as the matplotlib renderer in vision/render_board.py
+TILE_COLORS = {
+    "absent": (211, 211, 211),   # lightgray
+    "correct": (0, 128, 0),      # green
+    "present": (255, 165, 0),    # orange
+    "empty": (255, 255, 255),    # white
+}
+BACKGROUND = (255, 255, 255)
+BORDER = (0, 0, 0)
+TEXT = (0, 0, 0)
+
+CELL_SIZE = 64
+PADDING = 8
+
+# (char, cell_size) -> (cell_size, cell_size, 3) uint8 tile
+_sprites = {}
+_fonts = {}
+_lock = threading.Lock()
+
+
+def tile_state(letter):
+    if letter == '?':
+        return "absent"
+    if letter.isupper():
+        return "correct"
+    if letter.islower():
+        return "present"
+    return "empty"
+
+
+def _font(size):
+    font = _fonts.get(size)
+    if font is None:
+        try:
+            font = ImageFont.truetype("DejaVuSans-Bold.ttf", size)
+        except OSError:
+            try:
+                font = ImageFont.load_default(size=size)
+            except TypeError:  # Pillow < 10.1 has no sized default font
+                font = ImageFont.load_default()
+        _fonts[size] = font
+    return font
+
+
+def _draw_tile(letter, cell_size):
+    tile = Image.new("RGB", (cell_size, cell_size), TILE_COLORS[tile_state(letter)])
+    draw = ImageDraw.Draw(tile)
+    draw.rectangle([0, 0, cell_size - 1, cell_size - 1], outline=BORDER)
+    if letter.strip():
+        draw.text((cell_size / 2, cell_size / 2), letter.upper(), fill=TEXT,
+                  font=_font(cell_size // 2), anchor="mm")
+    return np.asarray(tile)
+
+
+def tile_sprite(letter, cell_size=CELL_SIZE):
+    """Pre-rendered tile for one feedback character; the state comes from its case."""
+    key = (letter, cell_size)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        with _lock:
+            sprite = _sprites.get(key)
+            if sprite is None:
+                sprite = _sprites[key] = _draw_tile(letter, cell_size)
+    return sprite
+
+
+def board_size(rows, word_length, cell_size=CELL_SIZE, padding=PADDING):
+    """(height, width) in pixels of a board with `rows` rows."""
+    return rows * cell_size + 2 * padding, word_length * cell_size + 2 * padding
+
+
+def new_board_array(rows, word_length, cell_size=CELL_SIZE, padding=PADDING):
+    height, width = board_size(rows, word_length, cell_size, padding)
+    board = np.empty((height, width, 3), dtype=np.uint8)
+    board[...] = BACKGROUND
+    return board
+
+
+def blit_row(board, row_idx, feedback, cell_size=CELL_SIZE, padding=PADDING):
+    """Copies the tiles for one feedback row into `board` in place."""
+    top = padding + row_idx * cell_size
+    for col_idx, letter in enumerate(feedback):
+        left = padding + col_idx * cell_size
+        board[top:top + cell_size, left:left + cell_size] = tile_sprite(letter, cell_size)
+
+
+def render_board_array(guesses, word_length=5, cell_size=CELL_SIZE, padding=PADDING):
+    """Renders feedback rows to an (height, width, 3) uint8 RGB array."""
+    board = new_board_array(len(guesses), word_length, cell_size, padding)
+    for row_idx, guess in enumerate(guesses):
+        blit_row(board, row_idx, guess, cell_size, padding)
+    return board
+
+
+def render_board_pil(guesses, word_length=5, as_array=False, cell_size=CELL_SIZE, padding=PADDING):
+    """Pillow/NumPy version of render_leword_board built from cached tile sprites."""
+    board = render_board_array(guesses, word_length, cell_size, padding)
+    if as_array:
+        return board
+    return Image.fromarray(board, "RGB")
@@ -0,0 +1,69 @@
+# vision/model_registry.py
+import threading
+
+# name -> zero-argument callable returning the loaded model bundle
+_loaders = {}
+# name -> loaded model bundle, one per process
+_models = {}
+_lock = threading.Lock()
+
+
+def register_model(name, loader):
+    """Registers how to load a model; nothing is loaded until first use."""
+    _loaders[name] = loader
+
+
+def get_model(name):
+    """Returns the model bundle for `name`, loading it on first use."""
+    model = _models.get(name)
+    if model is not None:
+        return model
+    with _lock:
+        # Another thread may have finished loading while we waited
+        if name not in _models:
+            _models[name] = _loaders[name]()
+        return _models[name]
+
+
+def is_loaded(name):
+    return name in _models
+
+
+def warm_up(*names):
+    """Loads the given models (every registered model by default) ahead of time."""
+    for name in names or list(_loaders):
+        get_model(name)
+
+
+def unload(name):
+    with _lock:
+        _models.pop(name, None)
+
+
+def _load_hf_clip():
+    from transformers import CLIPProcessor, CLIPModel
+
+    model = CLIPModel.from_pretrained("openai/clip-vit-base-patch32")
+    processor = CLIPProcessor.from_pretrained("openai/clip-vit-base-patch32")
+    model.eval()
+    return model, processor
+
+
+def _load_openai_clip():
+    import torch
+    import clip  # pip install git+https://github.com/openai/CLIP.git
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model, preprocess = clip.load("ViT-B/32", device=device)
+    return model, preprocess, device
+
+
+def _load_stub_clip():
+    from vision.stub_encoder import StubImageEncoder
+
+    return StubImageEncoder()
+
+
+register_model("hf-clip", _load_hf_clip)
+register_model("openai-clip", _load_openai_clip)
+register_model("stub-clip", _load_stub_clip)
@@ -1,10 +1,61 @@
 # vision/render_board.py
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import base64
 import io
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
+from tools.tracing import tracer
+
+# Bump whenever the rendered output changes, it keys cached board embeddings.
+RENDERER_VERSION = 3
+
+# "matplotlib" draws a full figure, "pil" blits cached tiles (vision/fast_render.py)
+BOARD_BACKEND = "pil"
+
+def board_backend(backend=None):
+    """The backend to draw with: `backend` if given, else BOARD_BACKEND."""
+    return backend or BOARD_BACKEND
+
+def renderer_id(backend=None):
+    """Identifies the exact renderer output, for cache keys."""
+    return f"{board_backend(backend)}-{RENDERER_VERSION}"
+
+def board_rows(attempts, word_length):
+    """Rows to draw for `attempts`; a rejected guess (pattern < 0) is a row of blank tiles."""
+    return [list(attempt.feedback) if attempt.pattern >= 0 else [' '] * word_length for attempt in attempts]
+
+def figure_to_array(fig):
+    """RGB pixels of a matplotlib figure, read from its canvas without a PNG round trip."""
+    fig.canvas.draw()
+    return np.array(fig.canvas.buffer_rgba())[:, :, :3]
+
+def encode_png(image):
+    """
+    PNG bytes of a PIL image or RGB array. Boards stay raw pixels inside the
+    process; this is only for images that leave it (tool results, files), and
+    each call is counted as "png_encodes" by the tracer.
+    """
+    tracer.count("png_encodes")
+    if not isinstance(image, Image.Image):
+        image = Image.fromarray(np.ascontiguousarray(image), "RGB")
+    buffered = io.BytesIO()
+    image.save(buffered, format="PNG")
+    return buffered.getvalue()
+
+def encode_png_base64(image):
+    return base64.b64encode(encode_png(image)).decode("utf-8")
+
+def render_leword_board(guesses, word_length=5, backend=None, as_array=False):
+    backend = board_backend(backend)
+    if backend == "pil":
+        from vision.fast_render import render_board_pil
+        return render_board_pil(guesses, word_length, as_array=as_array)
+    if backend != "matplotlib":
+        raise ValueError(f"Unknown board backend: {backend}")
+
+    # matplotlib is slow to import, only pay for it when a board is drawn
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
 
-def render_leword_board(guesses, word_length=5):
     fig, ax = plt.subplots(figsize=(word_length, len(guesses)))
     ax.axis("off")
 
@@ -27,11 +78,11 @@ def render_leword_board(guesses, word_length=5):
     ax.set_ylim(-len(guesses), 1)
     plt.tight_layout()
 
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png')
+    pixels = figure_to_array(fig)
     plt.close(fig)
-    buf.seek(0)
-    return Image.open(buf)
+    if as_array:
+        return pixels
+    return Image.fromarray(pixels, "RGB")
 
 
 
@@ -0,0 +1,26 @@
+# vision/stub_encoder.py
+import numpy as np
+from PIL import Image
+
+EMBEDDING_SIZE = 512  # same as CLIP ViT-B/32 image features
+THUMBNAIL = (32, 32)
+
+
+class StubImageEncoder:
+    """
+    Deterministic, model-free stand-in for the CLIP image encoder: a fixed random
+    projection of a small grayscale thumbnail. Equal boards give equal vectors,
+    so it works offline in benchmarks and tests.
+    """
+
+    def __init__(self, seed=0):
+        rng = np.random.default_rng(seed)
+        self.projection = rng.standard_normal((THUMBNAIL[0] * THUMBNAIL[1], EMBEDDING_SIZE)).astype(np.float32)
+
+    def encode(self, images):
+        pixels = np.stack([
+            np.asarray((image if isinstance(image, Image.Image) else Image.fromarray(image))
+                       .convert("L").resize(THUMBNAIL), dtype=np.float32).ravel() / 255.0
+            for image in images
+        ])
+        return pixels @ self.projection
@@ -0,0 +1,96 @@
+# vision/symbolic_encoder.py
+import numpy as np
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+N_LETTERS = len(ALPHABET)
+
+# Boards longer than this are truncated so every vector has the same size
+MAX_WORD_LENGTH = 12
+
+
+def feature_size(max_word_length=MAX_WORD_LENGTH):
+    """
+    Length of a board vector: per position a 'letter is here' and a 'letter is
+    not here' one-hot block, per letter min count, max count and 'max is known',
+    then attempts made and attempts left.
+    """
+    return 2 * max_word_length * N_LETTERS + 3 * N_LETTERS + 2
+
+
+def _letter_codes(words, word_length):
+    """(n_words, word_length) letter indices, -1 for anything outside a-z."""
+    data = np.frombuffer("".join(words).encode("latin-1"), dtype=np.uint8)
+    codes = data.reshape(len(words), word_length).astype(np.int16) - ord("a")
+    codes[(codes < 0) | (codes >= N_LETTERS)] = -1
+    return codes
+
+
+def _feedback_states(feedbacks, word_length):
+    """(n_rows, word_length) states: 0 for '?', 1 for lowercase, 2 for uppercase."""
+    data = np.frombuffer("".join(feedbacks).encode("latin-1"), dtype=np.uint8)
+    data = data.reshape(len(feedbacks), word_length)
+    states = np.zeros(data.shape, dtype=np.int8)
+    states[(data >= ord("a")) & (data <= ord("z"))] = 1
+    states[(data >= ord("A")) & (data <= ord("Z"))] = 2
+    return states
+
+
+def encode_boards(boards, word_length, attempts_left, max_word_length=MAX_WORD_LENGTH, max_attempts=10):
+    """
+    Encodes many boards at once into a (n_boards, feature_size) float32 array.
+
+    `boards` is a list of boards, each a list of (guess, feedback) rows; rows
+    whose length is not `word_length` (invalid guesses) are ignored.
+    `attempts_left` is one number per board.
+    """
+    n_boards = len(boards)
+    n_positions = min(word_length, max_word_length)
+    rows = [(b, guess.lower(), feedback) for b, board in enumerate(boards) for guess, feedback in board
+            if len(guess) == word_length and len(feedback) == word_length]
+
+    here = np.zeros((n_boards, max_word_length, N_LETTERS), dtype=np.float32)
+    not_here = np.zeros((n_boards, max_word_length, N_LETTERS), dtype=np.float32)
+    min_count = np.zeros((n_boards, N_LETTERS), dtype=np.int16)
+    max_count = np.full((n_boards, N_LETTERS), word_length, dtype=np.int16)
+    attempts_made = np.zeros(n_boards, dtype=np.float32)
+
+    if rows:
+        board_idx = np.array([b for b, _, _ in rows], dtype=np.intp)
+        letters = _letter_codes([guess for _, guess, _ in rows], word_length)
+        states = _feedback_states([feedback for _, _, feedback in rows], word_length)
+        valid = letters >= 0
+        np.add.at(attempts_made, board_idx, 1)
+
+        # Per-position facts, scattered from every row into its board
+        row_board = np.broadcast_to(board_idx[:, None], letters.shape)
+        positions = np.broadcast_to(np.arange(word_length), letters.shape)
+        keep = valid & (positions < n_positions)
+        correct = keep & (states == 2)
+        here[row_board[correct], positions[correct], letters[correct]] = 1.0
+        wrong = keep & (states != 2)
+        not_here[row_board[wrong], positions[wrong], letters[wrong]] = 1.0
+
+        # Per-row letter counts: scored copies give a minimum, a '?' copy caps it
+        one_hot = (letters[:, :, None] == np.arange(N_LETTERS)) & valid[:, :, None]
+        found = (one_hot & (states[:, :, None] > 0)).sum(axis=1).astype(np.int16)
+        capped = (one_hot & (states[:, :, None] == 0)).any(axis=1)
+        np.maximum.at(min_count, board_idx, found)
+        np.minimum.at(max_count, board_idx, np.where(capped, found, word_length).astype(np.int16))
+
+    features = np.concatenate([
+        here.reshape(n_boards, -1),
+        not_here.reshape(n_boards, -1),
+        min_count / word_length,
+        max_count / word_length,
+        (max_count < word_length).astype(np.float32),
+        (attempts_made / max_attempts)[:, None],
+        (np.asarray(attempts_left, dtype=np.float32) / max_attempts).reshape(n_boards, 1),
+    ], axis=1)
+    return features.astype(np.float32)
+
+
+def encode_game_state(game_state, max_word_length=MAX_WORD_LENGTH, max_attempts=10):
+    """Feature vector for one models.schemas.GameState."""
+    board = [(attempt.guess, attempt.feedback) for attempt in game_state.attempts]
+    return encode_boards([board], game_state.word_length, [game_state.attempts_left],
+                         max_word_length, max_attempts)[0]
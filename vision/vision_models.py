@@ -1,11 +1,10 @@
 from PIL import Image
-import torch
-import clip  # pip install git+https://github.com/openai/CLIP.git
+from vision.model_registry import get_model
 
-device = "cuda" if torch.cuda.is_available() else "cpu"
-model, preprocess = clip.load("ViT-B/32", device=device)
+def encode_board_image(image: Image.Image):
+    import torch
 
-def encode_board_image(image: Image.Image) -> torch.Tensor:
+    model, preprocess, device = get_model("openai-clip")
     image_input = preprocess(image).unsqueeze(0).to(device)
     with torch.no_grad():
         image_features = model.encode_image(image_input)